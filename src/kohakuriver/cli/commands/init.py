@@ -210,6 +210,9 @@ ADDITIONAL_MOUNTS: list[str] = []
 # Timeout for Docker image sync in seconds (default 10 minutes for large images)
 DOCKER_IMAGE_SYNC_TIMEOUT: int = 600
 
+# Max concurrent 'docker run' startups (dockerd slows down sharply above ~10)
+DOCKER_MAX_CONCURRENT_RUNS: int = 10
+
 # =============================================================================
 # Docker Network Configuration
 # =============================================================================
@@ -235,6 +238,12 @@ TUNNEL_ENABLED: bool = True
 # Path to tunnel-client binary (empty = auto-detect)
 TUNNEL_CLIENT_PATH: str = ""
 
+# Max bytes read from a VM port-forward connection per WebSocket frame
+TUNNEL_VM_READ_CHUNK: int = 262144
+
+# Socket send/receive buffer size for VM port-forward connections (0 = OS default)
+TUNNEL_VM_SOCKET_BUFFER: int = 2097152
+
 # =============================================================================
 # Logging Configuration
 # =============================================================================
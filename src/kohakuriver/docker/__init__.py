@@ -9,12 +9,13 @@ This package provides Docker management capabilities including:
 
 Submodules:
     - client: DockerManager class for container/image operations
+    - engine_api: Async Docker Engine API client over the local socket
     - exceptions: Docker-related exception classes
     - naming: Container/image naming utilities
     - utils: Tarball and sync utilities
 """
 
-from kohakuriver.docker import utils
+from kohakuriver.docker import engine_api, utils
 from kohakuriver.docker.client import DockerManager, get_docker_manager
 from kohakuriver.docker.exceptions import (
     ContainerCreationError,
@@ -45,7 +46,8 @@ from kohakuriver.docker.naming import (
 )
 
 __all__ = [
-    # Utils module
+    # Submodules
+    "engine_api",
     "utils",
     # Client
     "DockerManager",
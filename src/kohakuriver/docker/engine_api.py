@@ -0,0 +1,183 @@
+"""
+Async Docker Engine API client over the daemon's Unix socket.
+
+Used on runner hot paths (task pause/resume/kill, container exit events)
+where forking the docker CLI per operation is too expensive. A single httpx
+client keeps a persistent connection pool to dockerd for the lifetime of the
+process.
+
+When the daemon is not reachable through a local Unix socket (for example
+DOCKER_HOST points at a TCP endpoint), get_engine_client() returns None and
+callers fall back to the docker CLI.
+"""
+
+import contextlib
+import json
+import os
+from collections.abc import AsyncIterator
+
+import httpx
+
+from kohakuriver.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+
+_client: httpx.AsyncClient | None = None
+
+
+# =============================================================================
+# Client Lifecycle
+# =============================================================================
+
+
+def _docker_socket_path() -> str | None:
+    """Resolve the daemon's Unix socket path, or None if it is not local."""
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host:
+        if not docker_host.startswith("unix://"):
+            return None
+        path = docker_host[len("unix://") :]
+    else:
+        path = DEFAULT_DOCKER_SOCKET
+    return path if os.path.exists(path) else None
+
+
+def get_engine_client() -> httpx.AsyncClient | None:
+    """
+    Get the shared Engine API client, creating it on first use.
+
+    Returns:
+        The client, or None if no local Docker socket is available.
+    """
+    global _client
+    if _client is None:
+        socket_path = _docker_socket_path()
+        if socket_path is None:
+            return None
+        _client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=socket_path),
+            base_url="http://docker",
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        log.debug(f"Docker Engine API client connected to {socket_path}")
+    return _client
+
+
+async def close_engine_client() -> None:
+    """Close the shared Engine API client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# =============================================================================
+# Container Operations
+# =============================================================================
+
+
+def _error_message(response: httpx.Response) -> str:
+    """Format an Engine API error response as "<status> - <message>"."""
+    try:
+        message = response.json().get("message", response.text)
+    except ValueError:
+        message = response.text
+    return f"{response.status_code} - {message}"
+
+
+async def container_action(
+    client: httpx.AsyncClient, container: str, action: str
+) -> tuple[bool, str]:
+    """
+    POST a lifecycle action (kill, pause, unpause, ...) to a container.
+
+    Args:
+        client: Engine API client from get_engine_client().
+        container: Container name or ID.
+        action: Engine API action path segment (e.g. "kill", "pause").
+
+    Returns:
+        (success, error_message). error_message is empty on success.
+    """
+    response = await client.post(f"/containers/{container}/{action}")
+    if response.status_code in (204, 304):
+        return True, ""
+    return False, _error_message(response)
+
+
+async def container_state(client: httpx.AsyncClient, container: str) -> dict | None:
+    """
+    Get the State section of a container's inspect data.
+
+    Args:
+        client: Engine API client from get_engine_client().
+        container: Container name or ID.
+
+    Returns:
+        The State dict, or None if the container does not exist.
+    """
+    response = await client.get(f"/containers/{container}/json")
+    if response.status_code != 200:
+        return None
+    return response.json().get("State", {})
+
+
+async def image_id(client: httpx.AsyncClient, image: str) -> str | None:
+    """
+    Get the ID (sha256 digest) of a local image.
+
+    Args:
+        client: Engine API client from get_engine_client().
+        image: Image reference (e.g. "kohakuriver/base:base").
+
+    Returns:
+        The image ID, or None if the image does not exist locally.
+    """
+    response = await client.get(f"/images/{image}/json")
+    if response.status_code != 200:
+        return None
+    return response.json().get("Id")
+
+
+# =============================================================================
+# Events
+# =============================================================================
+
+
+async def _iter_events(response: httpx.Response) -> AsyncIterator[dict]:
+    """Yield the JSON-lines events of an open /events response."""
+    async for line in response.aiter_lines():
+        if line:
+            yield json.loads(line)
+
+
+@contextlib.asynccontextmanager
+async def event_stream(
+    client: httpx.AsyncClient,
+    filters: dict[str, list[str]],
+    since: int | None = None,
+) -> AsyncIterator[AsyncIterator[dict]]:
+    """
+    Subscribe to the daemon's event stream.
+
+    The subscription is active once the context is entered, so events for
+    containers started afterwards are guaranteed to be delivered.
+
+    Args:
+        client: Engine API client from get_engine_client().
+        filters: Engine API event filters (e.g. {"type": ["container"]}).
+        since: Unix timestamp to replay events from (e.g. after a reconnect).
+
+    Yields:
+        Async iterator of decoded event dicts.
+    """
+    params = {"filters": json.dumps(filters)}
+    if since is not None:
+        params["since"] = str(since)
+    async with client.stream(
+        "GET", "/events", params=params, timeout=httpx.Timeout(None, connect=5.0)
+    ) as response:
+        response.raise_for_status()
+        yield _iter_events(response)
@@ -19,13 +19,14 @@ from fastapi import WebSocket, WebSocketDisconnect
 from kohakuriver.db.node import Node
 from kohakuriver.db.task import Task
 from kohakuriver.docker.naming import task_container_name, vps_container_name
-from kohakuriver.utils.logger import get_logger
+from kohakuriver.utils.logger import get_logger, is_level_enabled
 
 logger = get_logger(__name__)
 
 # Protocol header format
 HEADER_FORMAT = ">BBIH"
 HEADER_SIZE = 8
+HEADER_STRUCT = struct.Struct(HEADER_FORMAT)
 
 # Message types
 MSG_CONNECT = 0x01
@@ -38,20 +39,28 @@ MSG_ERROR = 0x05
 PROTO_TCP = 0x00
 PROTO_UDP = 0x01
 
+# Message type names for logging
+_MSG_NAMES = {
+    MSG_CONNECT: "CONNECT",
+    MSG_CONNECTED: "CONNECTED",
+    MSG_DATA: "DATA",
+    MSG_CLOSE: "CLOSE",
+    MSG_ERROR: "ERROR",
+}
+
 
 def build_message(
     msg_type: int, proto: int, client_id: int, port: int = 0, payload: bytes = b""
 ) -> bytes:
     """Build a tunnel protocol message."""
-    header = struct.pack(HEADER_FORMAT, msg_type, proto, client_id, port)
-    return header + payload
+    return HEADER_STRUCT.pack(msg_type, proto, client_id, port) + payload
 
 
 def parse_header(data: bytes) -> tuple[int, int, int, int] | None:
     """Parse header. Returns (msg_type, proto, client_id, port) or None."""
     if len(data) < HEADER_SIZE:
         return None
-    return struct.unpack(HEADER_FORMAT, data[:HEADER_SIZE])
+    return HEADER_STRUCT.unpack_from(data)
 
 
 def get_payload(data: bytes) -> bytes:
@@ -59,6 +68,18 @@ def get_payload(data: bytes) -> bytes:
     return data[HEADER_SIZE:] if len(data) > HEADER_SIZE else b""
 
 
+def _log_frame(direction: str, data: bytes) -> None:
+    """Log a proxied protocol message at DEBUG level."""
+    header = parse_header(data)
+    if header:
+        msg_type, _, client_id, _ = header
+        msg_name = _MSG_NAMES.get(msg_type, f"TYPE_{msg_type}")
+        logger.debug(
+            f"[ForwardProxy] {direction}: {msg_name} client_id={client_id} "
+            f"payload={len(data) - HEADER_SIZE}b"
+        )
+
+
 async def get_task_runner_info(
     task_id: int,
 ) -> tuple[Task | None, Node | None, str | None]:
@@ -159,7 +180,7 @@ async def _proxy_cli_to_runner(
     Forward binary messages from CLI WebSocket to runner WebSocket.
 
     Reads binary protocol messages from the CLI client and forwards them
-    to the runner, logging message type and payload size.
+    to the runner, logging message type and payload size at DEBUG level.
 
     Args:
         websocket: The CLI client WebSocket.
@@ -170,19 +191,9 @@ async def _proxy_cli_to_runner(
         while True:
             # CLI sends binary protocol messages
             data = await websocket.receive_bytes()
-            header = parse_header(data)
-            if header:
-                msg_type, proto, client_id, port = header
-                msg_names = {
-                    MSG_CONNECT: "CONNECT",
-                    MSG_DATA: "DATA",
-                    MSG_CLOSE: "CLOSE",
-                }
-                msg_name = msg_names.get(msg_type, f"TYPE_{msg_type}")
-                payload_len = len(data) - HEADER_SIZE
-                logger.info(
-                    f"[ForwardProxy] CLI→Runner: {msg_name} client_id={client_id} payload={payload_len}b"
-                )
+            # Runs for every frame: only parse and format when it will be logged
+            if is_level_enabled("DEBUG"):
+                _log_frame("CLI→Runner", data)
             await runner_ws.send(data)
     except WebSocketDisconnect:
         logger.debug(f"[ForwardProxy] CLI disconnected (task={task_id})")
@@ -199,7 +210,7 @@ async def _proxy_runner_to_cli(
     Forward binary messages from runner WebSocket to CLI WebSocket.
 
     Reads messages from the runner and forwards them to the CLI client,
-    logging message type and payload size for binary messages.
+    logging message type and payload size for binary messages at DEBUG level.
 
     Args:
         runner_ws: The runner WebSocket.
@@ -209,21 +220,8 @@ async def _proxy_runner_to_cli(
     try:
         async for msg in runner_ws:
             if isinstance(msg, bytes):
-                header = parse_header(msg)
-                if header:
-                    msg_type, proto, client_id, port = header
-                    msg_names = {
-                        MSG_CONNECT: "CONNECT",
-                        MSG_CONNECTED: "CONNECTED",
-                        MSG_DATA: "DATA",
-                        MSG_CLOSE: "CLOSE",
-                        MSG_ERROR: "ERROR",
-                    }
-                    msg_name = msg_names.get(msg_type, f"TYPE_{msg_type}")
-                    payload_len = len(msg) - HEADER_SIZE
-                    logger.info(
-                        f"[ForwardProxy] Runner→CLI: {msg_name} client_id={client_id} payload={payload_len}b"
-                    )
+                if is_level_enabled("DEBUG"):
+                    _log_frame("Runner→CLI", msg)
                 await websocket.send_bytes(msg)
             else:
                 logger.info(f"[ForwardProxy] Runner→CLI: text={msg}")
@@ -14,6 +14,7 @@ import psutil
 from fastapi import FastAPI, Path, Query, WebSocket
 
 from kohakuriver.docker.client import DockerManager
+from kohakuriver.docker.engine_api import close_engine_client
 from kohakuriver.models.enums import LogLevel
 from kohakuriver.qemu.capability import apply_acs_override
 from kohakuriver.runner.background.heartbeat import send_heartbeat
@@ -30,6 +31,12 @@ from kohakuriver.runner.services.tunnel_server import (
     handle_port_forward,
     set_dependencies as tunnel_set_dependencies,
 )
+from kohakuriver.runner.services.task_executor import (
+    container_exit_watcher,
+    flush_status_reports,
+    shutdown_http_client,
+    status_sender_loop,
+)
 from kohakuriver.runner.services.vm_network_manager import get_vm_network_manager
 from kohakuriver.tunnel.protocol import PROTO_TCP, PROTO_UDP
 from kohakuriver.runner.numa.detector import detect_numa_topology
@@ -42,6 +49,9 @@ logger = get_logger(__name__)
 # Background tasks set
 background_tasks: set[asyncio.Task] = set()
 
+# Seconds shutdown waits for queued status reports to reach the host
+STATUS_FLUSH_TIMEOUT = 5.0
+
 # Global state
 numa_topology: dict | None = None
 task_store: TaskStateStore | None = None
@@ -210,6 +220,14 @@ async def startup_event():
         f"({config.RUNNER_BIND_IP}:{config.RUNNER_PORT})"
     )
 
+    # Tunnel and port-forward relays are pure socket I/O; make a fallback to
+    # the default selector loop visible since it roughly halves throughput
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if not loop_module.startswith("uvloop"):
+        logger.warning(
+            f"Running on {loop_module} event loop; install uvloop for faster tunnels"
+        )
+
     # Check Docker access and ensure network exists (in executor to avoid blocking)
     logger.info("Checking Docker access...")
     try:
@@ -268,6 +286,16 @@ async def startup_event():
     db_path = config.get_state_db_path()
     task_store = TaskStateStore(db_path)
 
+    # Start the background sender for task status reports
+    sender_task = asyncio.create_task(status_sender_loop())
+    background_tasks.add(sender_task)
+    sender_task.add_done_callback(background_tasks.discard)
+
+    # Start the Docker event watcher that resolves task container exits
+    exit_watcher_task = asyncio.create_task(container_exit_watcher())
+    background_tasks.add(exit_watcher_task)
+    exit_watcher_task.add_done_callback(background_tasks.discard)
+
     # Set dependencies on endpoint modules
     tasks.set_dependencies(task_store, numa_topology)
     vps.set_dependencies(task_store)
@@ -443,6 +471,12 @@ async def shutdown_event():
     """Clean shutdown."""
     logger.info("Runner shutting down.")
 
+    # Deliver queued status reports before the sender task is cancelled
+    try:
+        await asyncio.wait_for(flush_status_reports(), STATUS_FLUSH_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Timed out flushing status reports to host.")
+
     # Cancel background tasks
     for task in background_tasks:
         task.cancel()
@@ -452,6 +486,10 @@ async def shutdown_event():
         app.state.overlay_manager.close()
         logger.info("Overlay network manager closed")
 
+    # Close the shared host status-report client
+    await shutdown_http_client()
+    await close_engine_client()
+
     # Don't stop containers on shutdown - VPS containers have --restart unless-stopped
     # and should persist. Task containers will be cleaned up on next startup.
     if task_store:
@@ -486,6 +524,8 @@ def run():
         case LogLevel.WARNING:
             uvicorn_level = "warning"
 
+    # uvicorn's default loop="auto" runs on uvloop (shipped with
+    # uvicorn[standard]) when it is importable
     uvicorn.run(
         app,
         host=config.RUNNER_BIND_IP,
@@ -41,12 +41,17 @@ class RunnerConfig:
     TASKS_PRIVILEGED: bool = False
     ADDITIONAL_MOUNTS: list[str] = field(default_factory=list)
     DOCKER_IMAGE_SYNC_TIMEOUT: int = 600  # 10 minutes for large image syncs (10-30GB)
+    DOCKER_MAX_CONCURRENT_RUNS: int = 10  # Concurrent 'docker run' startups
 
     # Tunnel Configuration
     TUNNEL_ENABLED: bool = True  # Enable tunnel client in containers
     TUNNEL_CLIENT_PATH: str = (
         ""  # Path to tunnel-client binary (auto-detected if empty)
     )
+    TUNNEL_VM_READ_CHUNK: int = 262144  # Max bytes per VM port-forward read/frame
+    TUNNEL_VM_SOCKET_BUFFER: int = (
+        2097152  # SO_SNDBUF/SO_RCVBUF for VM port-forward sockets (0 = OS default)
+    )
 
     # Docker Network Configuration
     DOCKER_NETWORK_NAME: str = "kohakuriver-net"  # Custom bridge network for containers
@@ -101,7 +101,7 @@ async def kill_task_endpoint(request: TaskControlRequest):
             detail=f"Task {task_id} not found.",
         )
 
-    success = kill_task(task_id, container_name, task_store)
+    success = await kill_task(task_id, container_name, task_store)
     if not success:
         raise HTTPException(
             status_code=500,
@@ -127,7 +127,7 @@ async def pause_task_endpoint(request: TaskControlRequest):
             detail=f"Task {task_id} not found.",
         )
 
-    success = pause_task(task_id, container_name, task_store)
+    success = await pause_task(task_id, container_name, task_store)
     if not success:
         raise HTTPException(
             status_code=500,
@@ -153,7 +153,7 @@ async def resume_task_endpoint(request: TaskControlRequest):
             detail=f"Task {task_id} not found.",
         )
 
-    success = resume_task(task_id, container_name, task_store)
+    success = await resume_task(task_id, container_name, task_store)
     if not success:
         raise HTTPException(
             status_code=500,
@@ -16,7 +16,8 @@ from __future__ import annotations
 import asyncio
 import ipaddress
 import shutil
-import subprocess
+import socket
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -28,7 +29,41 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
+# =============================================================================
+# iptables Helpers (shared with the VM network manager)
+# =============================================================================
+
+
+def iptables_cidr(cidr: str) -> str:
+    """Normalize an address or CIDR to the network/len form iptables-save prints."""
+    return str(ipaddress.ip_network(cidr, strict=False))
+
+
+def parse_iptables_save(output: str) -> dict[str, set[str]]:
+    """
+    Collect the rules from iptables-save output.
+
+    Returns:
+        Mapping of table name to its "-A CHAIN ..." rule lines.
+    """
+    tables: dict[str, set[str]] = {}
+    rules: set[str] = set()
+    for line in output.splitlines():
+        if line.startswith("*"):
+            rules = tables.setdefault(line[1:], set())
+        elif line.startswith("-A "):
+            rules.add(line)
+    return tables
+
+
+def iptables_rule_saved(
+    saved: dict[str, set[str]], table: str, chain: str, spec: list[str]
+) -> bool:
+    """Check whether a rule is in a parse_iptables_save() dump."""
+    return f"-A {chain} {' '.join(spec)}" in saved.get(table, ())
+
+
+@dataclass(frozen=True)
 class OverlayConfig:
     """Overlay configuration received from Host during registration."""
 
@@ -59,6 +94,11 @@ class RunnerOverlayManager:
     VXLAN_NAME = "vxlan0"
     DOCKER_NETWORK_NAME = "kohakuriver-overlay"
 
+    # Seconds a health check result is reused by subsequent status polls
+    HEALTH_CACHE_TTL = 2.0
+    # Seconds between Docker network probes once the network is known to exist
+    DOCKER_PROBE_INTERVAL = 60.0
+
     def __init__(
         self,
         base_vxlan_id: int = 100,
@@ -71,9 +111,19 @@ class RunnerOverlayManager:
         self.mtu = mtu
 
         self._config: OverlayConfig | None = None
+        self._vni: int | None = None
         self._ipr = None
         self._setup_complete = False
 
+        # (monotonic timestamp, result) of the last health check
+        self._health_cache: tuple[float, bool] | None = None
+        self._health_lock = asyncio.Lock()
+
+        # Set once the Docker network is created/discovered; health checks
+        # only re-probe dockerd every DOCKER_PROBE_INTERVAL seconds
+        self._docker_network_exists = False
+        self._docker_probe_ts = 0.0
+
     def _get_ipr(self):
         """Get or create IPRoute instance."""
         if self._ipr is None:
@@ -95,7 +145,13 @@ class RunnerOverlayManager:
         Args:
             config: Overlay configuration from Host registration response
         """
+        # Re-setup with an unchanged config is a no-op while the network is up
+        if self._setup_complete and self._config == config and await self.is_healthy():
+            logger.info("Overlay network already set up with the same config")
+            return
+
         self._config = config
+        self._vni = self.base_vxlan_id + config.runner_id  # Unique VNI per runner
 
         logger.info(
             f"Setting up overlay network: runner_id={config.runner_id}, "
@@ -105,10 +161,14 @@ class RunnerOverlayManager:
         # Run network operations in executor
         await asyncio.to_thread(self._setup_network_sync)
 
-        # Create Docker network
-        await asyncio.to_thread(self._setup_docker_network_sync)
+        # Set up iptables/firewalld rules and the Docker network concurrently
+        await asyncio.gather(
+            self._setup_firewall_rules(),
+            asyncio.to_thread(self._setup_docker_network_sync),
+        )
 
         self._setup_complete = True
+        self._health_cache = None
         logger.info(
             f"Overlay network setup complete: Docker network={self.DOCKER_NETWORK_NAME}"
         )
@@ -137,6 +197,24 @@ class RunnerOverlayManager:
                 return link.get("index", link["index"]), link
         return None, None
 
+    @staticmethod
+    def _link_index(ipr, name: str) -> int | None:
+        """
+        Get the index of a link just created with ipr.link("add", ...).
+
+        The add reply is a bare ack, so the index is looked up by name with
+        a kernel-side filtered request instead of a full link scan.
+
+        Args:
+            ipr: IPRoute instance.
+            name: Interface name that was created.
+
+        Returns:
+            The interface index, or None if the link cannot be found.
+        """
+        indexes = ipr.link_lookup(ifname=name)
+        return indexes[0] if indexes else None
+
     def _ensure_bridge_sync(
         self, ipr, bridge_name: str, gateway: str, subnet: str, mtu: int
     ) -> int:
@@ -163,7 +241,7 @@ class RunnerOverlayManager:
         else:
             logger.info(f"Creating bridge: {bridge_name}")
             ipr.link("add", ifname=bridge_name, kind="bridge")
-            bridge_idx, _ = self._find_link_by_name(ipr, bridge_name)
+            bridge_idx = self._link_index(ipr, bridge_name)
 
         if bridge_idx is None:
             raise RuntimeError(f"Failed to create bridge {bridge_name}")
@@ -172,14 +250,12 @@ class RunnerOverlayManager:
         ipr.link("set", index=bridge_idx, state="up", mtu=mtu)
 
         # Add gateway IP to bridge if not present
-        existing_addrs = list(ipr.get_addr(index=bridge_idx))
-        has_ip = False
-        for addr in existing_addrs:
-            if addr.get_attr("IFA_ADDRESS") == gateway:
-                has_ip = True
-                break
+        existing_addrs = {
+            addr.get_attr("IFA_ADDRESS")
+            for addr in ipr.get_addr(index=bridge_idx, family=socket.AF_INET)
+        }
 
-        if not has_ip:
+        if gateway not in existing_addrs:
             # Extract prefix from subnet (e.g., "10.1.0.0/16" -> 16)
             prefix = int(subnet.split("/")[1])
             logger.info(f"Adding IP {gateway}/{prefix} to {bridge_name}")
@@ -251,7 +327,7 @@ class RunnerOverlayManager:
                 vxlan_learning=False,
             )
 
-            vxlan_idx, _ = self._find_link_by_name(ipr, vxlan_name)
+            vxlan_idx = self._link_index(ipr, vxlan_name)
 
         if vxlan_idx is None:
             raise RuntimeError(f"Failed to create VXLAN device {vxlan_name}")
@@ -290,11 +366,11 @@ class RunnerOverlayManager:
     def _setup_network_sync(self) -> None:
         """Set up VXLAN and bridge (synchronous)."""
         config = self._config
-        if config is None:
+        vni = self._vni
+        if config is None or vni is None:
             raise RuntimeError("OverlayConfig not set")
 
         ipr = self._get_ipr()
-        vni = self.base_vxlan_id + config.runner_id  # Unique VNI per runner
 
         # Create/configure bridge
         bridge_idx = self._ensure_bridge_sync(
@@ -321,9 +397,6 @@ class RunnerOverlayManager:
         host_gateway = config.host_ip_on_runner_subnet
         self._ensure_overlay_routes(ipr, bridge_idx, host_gateway, config)
 
-        # Set up iptables and firewalld rules for overlay forwarding
-        self._setup_firewall_rules()
-
         logger.info(f"Network setup complete: {self.VXLAN_NAME} -> {self.BRIDGE_NAME}")
 
     def _ensure_overlay_routes(
@@ -363,7 +436,96 @@ class RunnerOverlayManager:
             # Route may already exist
             logger.debug(f"Overlay route handling: {e}")
 
-    def _setup_firewall_rules(self) -> None:
+    @staticmethod
+    async def _run_command(
+        *cmd: str, timeout: float | None = None
+    ) -> tuple[int, str, str]:
+        """
+        Run a command without blocking the event loop.
+
+        Args:
+            cmd: Program and arguments.
+            timeout: Seconds to wait before killing the process.
+
+        Returns:
+            (returncode, stdout, stderr) with output decoded as text.
+
+        Raises:
+            FileNotFoundError: If the program does not exist.
+            asyncio.TimeoutError: If the command exceeds the timeout.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return (
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
+    async def _iptables_save(self, table: str) -> dict[str, set[str]] | None:
+        """
+        Dump the rules of one iptables table.
+
+        Args:
+            table: iptables table name (e.g. "filter", "nat").
+
+        Returns:
+            parse_iptables_save() result, or None if iptables-save failed.
+        """
+        try:
+            returncode, stdout, stderr = await self._run_command(
+                "iptables-save", "-t", table
+            )
+        except FileNotFoundError as e:
+            logger.debug(f"iptables-save not available, falling back to -C: {e}")
+            return None
+        if returncode != 0:
+            logger.debug(
+                f"iptables-save -t {table} failed, falling back to -C: {stderr.strip()}"
+            )
+            return None
+        return parse_iptables_save(stdout)
+
+    async def _iptables_rule_exists(
+        self,
+        saved: dict[str, set[str]] | None,
+        table: str,
+        chain: str,
+        spec: list[str],
+    ) -> bool:
+        """
+        Check whether a rule exists in a chain.
+
+        Uses the iptables-save dump when available, otherwise falls back
+        to a per-rule `iptables -C` invocation.
+
+        Args:
+            saved: Rule lines from _iptables_save(), or None.
+            table: iptables table name.
+            chain: Chain name (e.g. "FORWARD").
+            spec: Rule specification without the chain (e.g. ["-s", cidr, "-j", "ACCEPT"]).
+
+        Returns:
+            True if the rule is already present.
+        """
+        if saved is not None:
+            return iptables_rule_saved(saved, table, chain, spec)
+
+        returncode, _, _ = await self._run_command(
+            "iptables", "-w", "-t", table, "-C", chain, *spec
+        )
+        return returncode == 0
+
+    async def _setup_firewall_rules(self) -> None:
         """
         Set up iptables and firewalld rules to allow overlay traffic forwarding
         and NAT for external network access.
@@ -371,120 +533,115 @@ class RunnerOverlayManager:
         This ensures:
         1. Cross-node communication works even when firewalld blocks forwarding
         2. Containers can access external networks (internet) via NAT/masquerade
+
+        The filter, nat and firewalld phases are independent and run
+        concurrently; iptables calls use -w to wait on the xtables lock.
         """
         config = self._config
         if config is None:
             raise RuntimeError("OverlayConfig not set")
 
-        overlay_cidr = config.overlay_network_cidr
+        # Written the way iptables-save prints it so existing rules match
+        overlay_cidr = iptables_cidr(config.overlay_network_cidr)
+
+        await asyncio.gather(
+            self._setup_forward_rules(overlay_cidr),
+            self._setup_nat_rule(overlay_cidr),
+            self._setup_firewalld_zone(),
+        )
+
+    async def _setup_forward_rules(self, overlay_cidr: str) -> None:
+        """Insert FORWARD ACCEPT rules for the overlay network if missing."""
+        # Dump the table once and decide in userspace which rules are missing
+        filter_rules = await self._iptables_save("filter")
 
-        # Set up iptables FORWARD rules (insert at top of FORWARD chain)
+        # Set up iptables FORWARD rules (insert at top of FORWARD chain).
+        # Inserted in order since position 2 requires position 1 to exist.
         forward_rules = [
-            ["-I", "FORWARD", "1", "-s", overlay_cidr, "-j", "ACCEPT"],
-            ["-I", "FORWARD", "2", "-d", overlay_cidr, "-j", "ACCEPT"],
+            ("1", ["-s", overlay_cidr, "-j", "ACCEPT"]),
+            ("2", ["-d", overlay_cidr, "-j", "ACCEPT"]),
         ]
 
-        for rule in forward_rules:
-            # Check if rule exists (convert -I to -C for checking)
-            check_rule = [
-                "-C",
-                "FORWARD",
-                "-s" if "-s" in rule else "-d",
-                overlay_cidr,
-                "-j",
-                "ACCEPT",
-            ]
-            check_cmd = ["iptables"] + check_rule
-            try:
-                subprocess.run(check_cmd, check=True, capture_output=True)
+        for position, spec in forward_rules:
+            rule = ["-I", "FORWARD", position] + spec
+            if await self._iptables_rule_exists(
+                filter_rules, "filter", "FORWARD", spec
+            ):
                 logger.debug(f"iptables rule already exists: {' '.join(rule)}")
-            except subprocess.CalledProcessError:
-                # Rule doesn't exist, add it
-                add_cmd = ["iptables"] + rule
-                try:
-                    subprocess.run(add_cmd, check=True, capture_output=True)
-                    logger.info(f"Added iptables rule: {' '.join(rule)}")
-                except subprocess.CalledProcessError as e:
-                    logger.warning(f"Failed to add iptables rule {rule}: {e}")
-
-        # Set up NAT/masquerade for external network access
-        # This allows containers to reach the internet through the Runner
-        # Only masquerade traffic going to non-overlay destinations
-        nat_rule = [
-            "-t",
-            "nat",
-            "-A",
-            "POSTROUTING",
-            "-s",
-            overlay_cidr,
-            "!",
-            "-d",
-            overlay_cidr,
-            "-j",
-            "MASQUERADE",
-        ]
-        nat_check = [
-            "-t",
-            "nat",
-            "-C",
-            "POSTROUTING",
-            "-s",
-            overlay_cidr,
-            "!",
-            "-d",
-            overlay_cidr,
-            "-j",
-            "MASQUERADE",
-        ]
+                continue
+            returncode, _, stderr = await self._run_command("iptables", "-w", *rule)
+            if returncode == 0:
+                logger.info(f"Added iptables rule: {' '.join(rule)}")
+            else:
+                logger.warning(f"Failed to add iptables rule {rule}: {stderr.strip()}")
 
-        try:
-            subprocess.run(["iptables"] + nat_check, check=True, capture_output=True)
+    async def _setup_nat_rule(self, overlay_cidr: str) -> None:
+        """
+        Set up NAT/masquerade for external network access.
+
+        This allows containers to reach the internet through the Runner.
+        Only traffic going to non-overlay destinations is masqueraded.
+        """
+        nat_rules = await self._iptables_save("nat")
+        nat_spec = ["-s", overlay_cidr, "!", "-d", overlay_cidr, "-j", "MASQUERADE"]
+
+        if await self._iptables_rule_exists(nat_rules, "nat", "POSTROUTING", nat_spec):
             logger.debug("NAT masquerade rule already exists")
-        except subprocess.CalledProcessError:
-            try:
-                subprocess.run(["iptables"] + nat_rule, check=True, capture_output=True)
-                logger.info("Added NAT masquerade rule for external network access")
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to add NAT masquerade rule: {e}")
+            return
+
+        returncode, _, stderr = await self._run_command(
+            "iptables", "-w", "-t", "nat", "-A", "POSTROUTING", *nat_spec
+        )
+        if returncode == 0:
+            logger.info("Added NAT masquerade rule for external network access")
+        else:
+            logger.warning(f"Failed to add NAT masquerade rule: {stderr.strip()}")
 
+    async def _setup_firewalld_zone(self) -> None:
+        """Add the overlay interfaces to firewalld's trusted zone if it is running."""
         # Check if firewall-cmd exists and firewalld is running
         if shutil.which("firewall-cmd") is None:
             logger.debug("firewall-cmd not found, skipping firewalld configuration")
             return
 
         try:
-            result = subprocess.run(
-                ["firewall-cmd", "--state"],
-                capture_output=True,
-                text=True,
-                timeout=5,
+            returncode, stdout, _ = await self._run_command(
+                "firewall-cmd", "--state", timeout=5
             )
-            if result.returncode != 0 or "running" not in result.stdout:
+            if returncode != 0 or "running" not in stdout:
                 logger.debug(
                     "firewalld is not running, skipping firewalld configuration"
                 )
                 return
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        except (asyncio.TimeoutError, FileNotFoundError):
             logger.debug("Could not check firewalld state, skipping")
             return
 
         # Add overlay interfaces to trusted zone
-        for interface in [self.BRIDGE_NAME, self.VXLAN_NAME]:
-            try:
-                result = subprocess.run(
-                    ["firewall-cmd", "--zone=trusted", f"--add-interface={interface}"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.returncode == 0:
-                    logger.info(f"Added {interface} to firewalld trusted zone")
-                else:
-                    logger.debug(f"firewall-cmd output: {result.stderr.strip()}")
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Timeout adding {interface} to firewalld trusted zone")
-            except Exception as e:
-                logger.warning(f"Failed to add {interface} to firewalld: {e}")
+        await asyncio.gather(
+            *(
+                self._add_trusted_interface(interface)
+                for interface in [self.BRIDGE_NAME, self.VXLAN_NAME]
+            )
+        )
+
+    async def _add_trusted_interface(self, interface: str) -> None:
+        """Add a single interface to firewalld's trusted zone."""
+        try:
+            returncode, _, stderr = await self._run_command(
+                "firewall-cmd",
+                "--zone=trusted",
+                f"--add-interface={interface}",
+                timeout=10,
+            )
+            if returncode == 0:
+                logger.info(f"Added {interface} to firewalld trusted zone")
+            else:
+                logger.debug(f"firewall-cmd output: {stderr.strip()}")
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout adding {interface} to firewalld trusted zone")
+        except Exception as e:
+            logger.warning(f"Failed to add {interface} to firewalld: {e}")
 
     def _setup_docker_network_sync(self) -> None:
         """Create Docker network using the overlay bridge (synchronous)."""
@@ -496,24 +653,28 @@ class RunnerOverlayManager:
         if config is None:
             raise RuntimeError("OverlayConfig not set")
 
-        # Check if network exists
-        try:
-            network = client.networks.get(self.DOCKER_NETWORK_NAME)
+        # Check if network exists (the name filter matches substrings, so
+        # compare exact names; an empty list means it is absent)
+        networks = [
+            network
+            for network in client.networks.list(names=[self.DOCKER_NETWORK_NAME])
+            if network.name == self.DOCKER_NETWORK_NAME
+        ]
+        if networks:
+            network = networks[0]
             logger.info(f"Docker network {self.DOCKER_NETWORK_NAME} already exists")
 
             # Verify it's using our bridge
-            network_config = network.attrs.get("Options", {})
+            network_config = network.attrs.get("Options") or {}
             bridge_name = network_config.get("com.docker.network.bridge.name")
-            if bridge_name != self.BRIDGE_NAME:
-                logger.warning(
-                    f"Existing network uses bridge '{bridge_name}', expected '{self.BRIDGE_NAME}'. Recreating."
-                )
-                network.remove()
-                raise docker.errors.NotFound("Recreating network")
+            if bridge_name == self.BRIDGE_NAME:
+                self._mark_docker_network_exists()
+                return
 
-            return
-        except docker.errors.NotFound:
-            pass
+            logger.warning(
+                f"Existing network uses bridge '{bridge_name}', expected '{self.BRIDGE_NAME}'. Recreating."
+            )
+            network.remove()
 
         # Create network using our bridge
         # Use the runner's subnet for IPAM
@@ -541,8 +702,14 @@ class RunnerOverlayManager:
             },
         )
 
+        self._mark_docker_network_exists()
         logger.info(f"Created Docker network {self.DOCKER_NETWORK_NAME}")
 
+    def _mark_docker_network_exists(self) -> None:
+        """Record that the Docker network was just seen to exist."""
+        self._docker_network_exists = True
+        self._docker_probe_ts = time.monotonic()
+
     async def teardown(self) -> None:
         """
         Tear down the overlay network.
@@ -562,12 +729,14 @@ class RunnerOverlayManager:
         await asyncio.to_thread(self._teardown_network_sync)
 
         self._setup_complete = False
+        self._health_cache = None
         logger.info("Overlay network teardown complete")
 
     def _teardown_docker_network_sync(self) -> None:
         """Remove Docker network (synchronous)."""
         import docker
 
+        self._docker_network_exists = False
         try:
             client = docker.from_env()
             network = client.networks.get(self.DOCKER_NETWORK_NAME)
@@ -597,15 +766,31 @@ class RunnerOverlayManager:
                 break
 
     async def is_healthy(self) -> bool:
-        """Check if overlay network is healthy."""
+        """
+        Check if overlay network is healthy.
+
+        Results are cached for HEALTH_CACHE_TTL seconds and concurrent
+        callers share a single in-flight check.
+        """
         if not self._setup_complete or self._config is None:
             return False
 
-        try:
-            return await asyncio.to_thread(self._check_health_sync)
-        except Exception as e:
-            logger.warning(f"Overlay health check failed: {e}")
-            return False
+        async with self._health_lock:
+            cached = self._health_cache
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.HEALTH_CACHE_TTL
+            ):
+                return cached[1]
+
+            try:
+                healthy = await asyncio.to_thread(self._check_health_sync)
+            except Exception as e:
+                logger.warning(f"Overlay health check failed: {e}")
+                healthy = False
+
+            self._health_cache = (time.monotonic(), healthy)
+            return healthy
 
     def _check_health_sync(self) -> bool:
         """Check health (synchronous)."""
@@ -635,16 +820,24 @@ class RunnerOverlayManager:
             logger.warning("Overlay VXLAN is not up")
             return False
 
-        # Check Docker network exists
+        # Check Docker network exists, trusting a recent positive probe
+        if (
+            self._docker_network_exists
+            and time.monotonic() - self._docker_probe_ts < self.DOCKER_PROBE_INTERVAL
+        ):
+            return True
+
         import docker
 
         try:
             client = docker.from_env()
             client.networks.get(self.DOCKER_NETWORK_NAME)
         except docker.errors.NotFound:
+            self._docker_network_exists = False
             logger.warning("Overlay Docker network not found")
             return False
 
+        self._mark_docker_network_exists()
         return True
 
     async def get_status(self) -> dict:
@@ -3,17 +3,22 @@ Task execution service.
 
 Handles Docker container creation and task lifecycle management.
 Uses subprocess-based Docker execution for task containers (matching old behavior).
+Kill/pause/resume go through the Docker Engine API over the local socket.
 """
 
 import asyncio
 import datetime
 import functools
 import os
+import posixpath
+import re
 import shlex
 import subprocess
+import time
 
 import httpx
 
+from kohakuriver.docker import engine_api
 from kohakuriver.docker import utils as docker_utils
 from kohakuriver.docker.naming import image_tag, task_container_name
 from kohakuriver.models.requests import TaskStatusUpdate
@@ -22,6 +27,7 @@ from kohakuriver.runner.numa.detector import get_numa_prefix
 from kohakuriver.runner.services.tunnel_helper import (
     get_tunnel_env_vars,
     get_tunnel_mount,
+    invalidate_tunnel_path,
     wrap_command_with_tunnel,
 )
 from kohakuriver.storage.vault import TaskStateStore
@@ -29,12 +35,112 @@ from kohakuriver.utils.logger import format_traceback, get_logger
 
 logger = get_logger(__name__)
 
-# Lock for Docker image sync operations to prevent concurrent syncs
-docker_sync_lock = asyncio.Lock()
+# Per-image locks so concurrent syncs of the same image are serialized while
+# syncs of different images proceed in parallel
+_image_locks: dict[str, asyncio.Lock] = {}
+
+# container_name -> (tarball dir mtime_ns, local image ID, monotonic expiry) of
+# the last successful up-to-date check; lets warm nodes skip the lock and the
+# full needs_sync check
+_sync_cache: dict[str, tuple[int, str | None, float]] = {}
+
+# Seconds an up-to-date result is trusted outright while the tarball dir is
+# unchanged; after that it is revalidated against the cached image ID
+SYNC_CACHE_TTL = 60.0
+
+# (config key, argv) cache of the "--mount" arguments shared by all tasks
+_static_mount_args: tuple[tuple, list[str]] | None = None
+
+# Matches strings shlex.quote would return unchanged (same safe character set)
+_SHELL_SAFE = re.compile(r"[\w@%+=:,./-]+\Z", re.ASCII).match
+
+# (NUMA node, topology identity, numactl path) -> numactl prefix
+_numa_prefix_cache: dict[tuple[int | None, int, str], str] = {}
+
+# Log directories known to exist (bounded; cleared when full)
+_known_output_dirs: set[str] = set()
+_KNOWN_OUTPUT_DIRS_MAX = 4096
+
+# Bounds concurrent 'docker run' startups (created on first use from config;
+# not reset by invalidate_config_snapshot, so a new limit needs a restart)
+_docker_run_sem: asyncio.Semaphore | None = None
+
+# Seconds a 'docker run' holds its semaphore slot while the container starts
+# (used when the Engine API cannot confirm that the container is running)
+DOCKER_RUN_STARTUP_SECONDS = 5.0
+
+# Seconds between container state checks while a startup holds its slot
+DOCKER_RUN_POLL_SECONDS = 0.2
+
+# task_id -> event set by kill_tasks so execute_task stops waiting right away
+_kill_events: dict[int, asyncio.Event] = {}
+
+# Seconds execute_task waits for a killed container's docker process to exit
+KILL_CLEANUP_SECONDS = 10.0
+
+# container name -> future resolved with its exit code by container_exit_watcher
+_exit_futures: dict[str, asyncio.Future[int]] = {}
+
+# True while container_exit_watcher holds a live event subscription
+_exit_stream_live = False
+
+# Seconds after an event stream reconnect before pending exits are reconciled
+EXIT_RECONCILE_DELAY = 5.0
+
+# Seconds between container state checks while the event stream is down
+EXIT_POLL_SECONDS = 5.0
+
+# Seconds between container state checks while the event stream is live
+EXIT_LIVE_POLL_SECONDS = 60.0
+
+# Pending reconcile passes (referenced here so they are not collected mid-run)
+_reconcile_tasks: set[asyncio.Task] = set()
+
+# Shared HTTP client for status reports (keeps connections to the host alive)
+_http_client: httpx.AsyncClient | None = None
+
+# A queued status update and an optional future resolved once it was handled
+_QueuedUpdate = tuple[TaskStatusUpdate, asyncio.Future | None]
+
+# Status updates waiting for the background sender (None until it is started)
+_update_queue: asyncio.Queue[_QueuedUpdate] | None = None
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Delivery attempts per status update when the host is unreachable
+STATUS_REPORT_RETRIES = 3
+
+# Statuses after which the host expects no further updates for a task
+_TERMINAL_STATUSES = frozenset(
+    {"completed", "failed", "killed", "killed_oom", "lost", "stopped"}
+)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client used to report to the host."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=f"http://{config.HOST_ADDRESS}:{config.HOST_PORT}",
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            timeout=httpx.Timeout(15.0, connect=5.0),
+        )
+    return _http_client
+
+
+async def shutdown_http_client() -> None:
+    """Close the shared HTTP client. Called on runner shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 def _run_docker_command(
-    cmd: list[str], check: bool = False, timeout: int | None = None
+    cmd: list[str],
+    check: bool = False,
+    timeout: int | None = None,
+    capture_stdout: bool = False,
 ) -> subprocess.CompletedProcess:
     """
     Run a Docker command via subprocess.
@@ -43,6 +149,8 @@ def _run_docker_command(
         cmd: Command list to run.
         check: If True, raise CalledProcessError on non-zero exit.
         timeout: Optional timeout in seconds.
+        capture_stdout: If True, capture stdout; otherwise it is discarded
+            (result.stdout is None). stderr is always captured.
 
     Returns:
         CompletedProcess result.
@@ -51,7 +159,8 @@ def _run_docker_command(
     try:
         result = subprocess.run(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=check,
             timeout=timeout,
@@ -75,35 +184,34 @@ def _run_docker_command(
         raise
 
 
-async def report_status_to_host(update: TaskStatusUpdate):
+async def _post_status_update(update: TaskStatusUpdate) -> bool:
     """
-    Report task status update to the host.
+    POST a single status update to the host.
 
     Args:
         update: Task status update data.
-    """
-    host_url = f"http://{config.HOST_ADDRESS}:{config.HOST_PORT}"
-    logger.debug(
-        f"[Task {update.task_id}] report_status_to_host called: status={update.status}"
-    )
-    logger.info(
-        f"[Task {update.task_id}] Reporting status '{update.status}' to host {host_url}"
-    )
 
+    Returns:
+        True if the host accepted the update. Only connection errors
+        return False (worth retrying); rejected updates count as delivered.
+    """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{host_url}/api/update",
-                json=update.model_dump(mode="json"),
-                timeout=15.0,
-            )
-            response.raise_for_status()
+        client = _get_http_client()
+        # Serialize once through pydantic's JSON encoder (no dict intermediate)
+        response = await client.post(
+            "/api/update",
+            content=update.model_dump_json().encode(),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
         logger.info(
             f"[Task {update.task_id}] Host acknowledged status update: {update.status}"
         )
+        return True
 
     except httpx.RequestError as e:
         logger.error(f"[Task {update.task_id}] Failed to report status to host: {e}")
+        return False
     except httpx.HTTPStatusError as e:
         logger.error(
             f"[Task {update.task_id}] Host rejected status update: "
@@ -113,6 +221,232 @@ async def report_status_to_host(update: TaskStatusUpdate):
         logger.exception(
             f"[Task {update.task_id}] Unexpected error reporting status: {e}"
         )
+    return True
+
+
+async def status_sender_loop():
+    """
+    Background task that delivers queued status updates to the host in order.
+
+    Started once at runner startup; until it runs, report_status_to_host
+    posts updates inline.
+    """
+    global _update_queue
+
+    queue = _update_queue = asyncio.Queue()
+    logger.info("Status report sender started.")
+    try:
+        while True:
+            update, handled = await queue.get()
+            try:
+                for attempt in range(STATUS_REPORT_RETRIES):
+                    if await _post_status_update(update):
+                        break
+                    if attempt < STATUS_REPORT_RETRIES - 1:
+                        await asyncio.sleep(attempt + 1)
+            finally:
+                if handled is not None and not handled.done():
+                    handled.set_result(None)
+                queue.task_done()
+    finally:
+        _update_queue = None
+        # Release reporters still waiting on updates that will not be sent
+        while not queue.empty():
+            _, handled = queue.get_nowait()
+            if handled is not None and not handled.done():
+                handled.set_result(None)
+            queue.task_done()
+
+
+async def _reconcile_exit_futures() -> None:
+    """
+    Resolve exit futures whose container has already stopped.
+
+    Covers 'die' events that the daemon could not replay after the event
+    stream was interrupted (e.g. dockerd restarted). Containers that are gone
+    or not started yet are left to _wait_detached_exit.
+    """
+    await asyncio.sleep(EXIT_RECONCILE_DELAY)
+    client = engine_api.get_engine_client()
+    if client is None:
+        return
+    for name, future in list(_exit_futures.items()):
+        if future.done():
+            continue
+        try:
+            state = await engine_api.container_state(client, name)
+        except httpx.HTTPError as e:
+            logger.debug(f"Exit reconcile for {name} failed: {e}")
+            continue
+        if state is None or state.get("Status") == "created":
+            continue
+        if not state.get("Running", False):
+            future.set_result(int(state.get("ExitCode", -1)))
+
+
+async def container_exit_watcher():
+    """
+    Background task that resolves container exits from the Docker event stream.
+
+    One Engine API subscription replaces a blocking 'docker run' process per
+    task. While it is not connected, tasks fall back to attached 'docker run'.
+    """
+    global _exit_stream_live
+
+    client = engine_api.get_engine_client()
+    if client is None:
+        logger.info("Docker socket not available; tasks wait on 'docker run'.")
+        return
+
+    filters = {"type": ["container"], "event": ["die"]}
+    since = None
+    logger.info("Container exit watcher started.")
+    try:
+        while True:
+            if since is None:
+                since = int(time.time())
+            try:
+                async with engine_api.event_stream(client, filters, since) as events:
+                    if _exit_futures:
+                        reconcile = asyncio.create_task(_reconcile_exit_futures())
+                        _reconcile_tasks.add(reconcile)
+                        reconcile.add_done_callback(_reconcile_tasks.discard)
+                    _exit_stream_live = True
+                    async for event in events:
+                        since = event.get("time", since)
+                        attributes = event.get("Actor", {}).get("Attributes", {})
+                        future = _exit_futures.get(attributes.get("name"))
+                        if future is not None and not future.done():
+                            future.set_result(int(attributes.get("exitCode", -1)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Docker event stream interrupted: {e}")
+            _exit_stream_live = False
+            await asyncio.sleep(1)
+    finally:
+        _exit_stream_live = False
+        for reconcile in list(_reconcile_tasks):
+            reconcile.cancel()
+
+
+async def flush_status_reports():
+    """Wait until every queued status update has been delivered (or given up)."""
+    queue = _update_queue
+    if queue is not None:
+        await queue.join()
+
+
+async def _wait_container_started(
+    process: asyncio.subprocess.Process, container_name: str
+) -> None:
+    """
+    Wait until a 'docker run' has started its container (or exited).
+
+    With the Engine API this returns as soon as the container is running or
+    has already stopped; without it, after at most DOCKER_RUN_STARTUP_SECONDS.
+    """
+    exited = asyncio.ensure_future(process.wait())
+    try:
+        client = engine_api.get_engine_client()
+        if client is None:
+            await asyncio.wait({exited}, timeout=DOCKER_RUN_STARTUP_SECONDS)
+            return
+
+        while True:
+            # A detached run exits once the container has started
+            await asyncio.wait({exited}, timeout=DOCKER_RUN_POLL_SECONDS)
+            if exited.done():
+                return
+            try:
+                state = await engine_api.container_state(client, container_name)
+            except httpx.HTTPError as e:
+                logger.debug(f"Startup check for {container_name} failed: {e}")
+                await asyncio.wait({exited}, timeout=DOCKER_RUN_STARTUP_SECONDS)
+                return
+            if state is not None and state.get("Status") != "created":
+                return
+    finally:
+        exited.cancel()
+
+
+async def _wait_detached_exit(
+    container_name: str, exit_future: asyncio.Future[int]
+) -> int:
+    """
+    Wait for the exit code of a started detached container.
+
+    The code normally arrives from container_exit_watcher. The container
+    state is also polled, often while the event stream is down and rarely
+    while it is live, in case a 'die' event was lost across a reconnect.
+    """
+    while True:
+        interval = EXIT_LIVE_POLL_SECONDS if _exit_stream_live else EXIT_POLL_SECONDS
+        await asyncio.wait({exit_future}, timeout=interval)
+        if exit_future.done():
+            return exit_future.result()
+        client = engine_api.get_engine_client()
+        if client is None:
+            continue
+        try:
+            state = await engine_api.container_state(client, container_name)
+        except httpx.HTTPError as e:
+            logger.debug(f"Exit check for {container_name} failed: {e}")
+            continue
+        if state is None:
+            # '--rm' removes the container right after its 'die' event, so
+            # give the watcher a moment to deliver it
+            await asyncio.wait({exit_future}, timeout=EXIT_RECONCILE_DELAY)
+            if exit_future.done():
+                return exit_future.result()
+            logger.warning(
+                f"Container {container_name} disappeared without an exit event."
+            )
+            return -1
+        if not state.get("Running", False):
+            return int(state.get("ExitCode", -1))
+
+
+def _get_docker_run_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent container startups."""
+    global _docker_run_sem
+    if _docker_run_sem is None:
+        _docker_run_sem = asyncio.Semaphore(max(1, config.DOCKER_MAX_CONCURRENT_RUNS))
+    return _docker_run_sem
+
+
+async def report_status_to_host(update: TaskStatusUpdate):
+    """
+    Report task status update to the host.
+
+    Updates are handed to the background sender so task progression does
+    not wait on the host round-trip. Terminal statuses wait until that
+    update itself has been handled, so callers return only after the final
+    state was delivered (or given up on).
+
+    Args:
+        update: Task status update data.
+    """
+    logger.debug(
+        f"[Task {update.task_id}] report_status_to_host called: status={update.status}"
+    )
+    logger.info(
+        f"[Task {update.task_id}] Reporting status '{update.status}' to host "
+        f"http://{config.HOST_ADDRESS}:{config.HOST_PORT}"
+    )
+
+    queue = _update_queue
+    if queue is None:
+        await _post_status_update(update)
+        return
+
+    if update.status not in _TERMINAL_STATUSES:
+        queue.put_nowait((update, None))
+        return
+
+    handled = asyncio.get_running_loop().create_future()
+    queue.put_nowait((update, handled))
+    await handled
 
 
 async def docker_pull(image: str, timeout: int = 600) -> bool:
@@ -151,6 +485,36 @@ async def docker_pull(image: str, timeout: int = 600) -> bool:
         return False
 
 
+def _get_image_lock(container_name: str) -> asyncio.Lock:
+    """Get (or create) the sync lock for one container image."""
+    lock = _image_locks.get(container_name)
+    if lock is None:
+        lock = _image_locks[container_name] = asyncio.Lock()
+    return lock
+
+
+async def _local_image_id(container_name: str) -> str | None:
+    """Get the local image ID for a container via the Engine API, if reachable."""
+    client = engine_api.get_engine_client()
+    if client is None:
+        return None
+    try:
+        return await engine_api.image_id(client, image_tag(container_name))
+    except httpx.HTTPError as e:
+        logger.debug(f"Image ID lookup failed for '{container_name}': {e}")
+        return None
+
+
+async def _record_sync_cache(container_name: str, tar_dir_mtime_ns: int | None) -> None:
+    """Remember that an image is current for the given tarball dir mtime."""
+    if tar_dir_mtime_ns is not None:
+        _sync_cache[container_name] = (
+            tar_dir_mtime_ns,
+            await _local_image_id(container_name),
+            time.monotonic() + SYNC_CACHE_TTL,
+        )
+
+
 async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
     """
     Ensure the Docker image is synced from shared storage before running a task.
@@ -160,6 +524,11 @@ async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
     2. Get latest shared tarball timestamp
     3. If shared is newer (or local doesn't exist), load the tarball
 
+    An up-to-date result is cached per container for SYNC_CACHE_TTL seconds
+    as long as the tarball directory's mtime does not change. Once expired,
+    the entry is renewed by a single image ID lookup if the local image is
+    still the one that was verified.
+
     Args:
         task_id: Task ID (for logging).
         container_name: KohakuRiver container name (e.g., "kohakuriver-base").
@@ -172,14 +541,50 @@ async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
         f"[Task {task_id}] ensure_docker_image_synced: container={container_name}, tar_dir={container_tar_dir}"
     )
 
+    # Fast path: tarball directory unchanged since the last up-to-date check
+    try:
+        tar_dir_mtime_ns = os.stat(container_tar_dir).st_mtime_ns
+    except OSError:
+        tar_dir_mtime_ns = None
+    cached = _sync_cache.get(container_name)
+    if tar_dir_mtime_ns is not None and cached and cached[0] == tar_dir_mtime_ns:
+        _, cached_image_id, expiry = cached
+        fresh = time.monotonic() < expiry
+        if not fresh and cached_image_id is not None:
+            # Expired: one image ID lookup instead of the full needs_sync check
+            fresh = await _local_image_id(container_name) == cached_image_id
+            if fresh:
+                _sync_cache[container_name] = (
+                    tar_dir_mtime_ns,
+                    cached_image_id,
+                    time.monotonic() + SYNC_CACHE_TTL,
+                )
+        if fresh:
+            logger.info(
+                f"Task {task_id}: Local Docker image '{container_name}' is up-to-date (cached)."
+            )
+            return True
+
     try:
-        async with docker_sync_lock:
-            logger.debug(f"[Task {task_id}] Acquired docker_sync_lock")
+        # Cheap check without any lock; most tasks stop here
+        needs_sync, sync_path = await asyncio.to_thread(
+            docker_utils.needs_sync, container_name, container_tar_dir
+        )
+        logger.debug(f"[Task {task_id}] needs_sync={needs_sync}, sync_path={sync_path}")
 
-            # Check if sync is needed
-            logger.debug(f"[Task {task_id}] Calling docker_utils.needs_sync()...")
-            needs_sync, sync_path = docker_utils.needs_sync(
-                container_name, container_tar_dir
+        if not needs_sync:
+            logger.info(
+                f"Task {task_id}: Local Docker image '{container_name}' is up-to-date."
+            )
+            await _record_sync_cache(container_name, tar_dir_mtime_ns)
+            return True
+
+        async with _get_image_lock(container_name):
+            logger.debug(f"[Task {task_id}] Acquired sync lock for '{container_name}'")
+
+            # Re-check: another task may have synced this image while we waited
+            needs_sync, sync_path = await asyncio.to_thread(
+                docker_utils.needs_sync, container_name, container_tar_dir
             )
             logger.debug(
                 f"[Task {task_id}] needs_sync={needs_sync}, sync_path={sync_path}"
@@ -189,8 +594,11 @@ async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
                 logger.info(
                     f"Task {task_id}: Local Docker image '{container_name}' is up-to-date."
                 )
+                await _record_sync_cache(container_name, tar_dir_mtime_ns)
                 return True
 
+            _sync_cache.pop(container_name, None)
+
             if not sync_path:
                 # needs_sync is True but no path - this means no tarball exists
                 logger.error(
@@ -223,6 +631,7 @@ async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
                 return False
 
             logger.info(f"Task {task_id}: Docker image sync successful.")
+            await _record_sync_cache(container_name, tar_dir_mtime_ns)
             return True
 
     except Exception as e:
@@ -231,6 +640,62 @@ async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
         return False
 
 
+def _get_static_mount_args() -> list[str]:
+    """
+    Get the "--mount" arguments shared by every task container.
+
+    The argv is built once and reused for as long as the config values it
+    depends on stay unchanged.
+
+    Returns:
+        Flat list of "--mount", "type=bind,..." arguments.
+    """
+    global _static_mount_args
+
+    key = (
+        config.SHARED_DIR,
+        config.LOCAL_TEMP_DIR,
+        tuple(config.ADDITIONAL_MOUNTS),
+        config.TUNNEL_ENABLED,
+        config.TUNNEL_CLIENT_PATH,
+    )
+    if _static_mount_args is not None and _static_mount_args[0] == key:
+        return _static_mount_args[1]
+
+    # shared_data subdirectory is mounted as /shared inside container
+    # logs directory is mounted as /kohakuriver-logs for task output
+    mount_dirs = [
+        f"{config.SHARED_DIR}/shared_data:/shared",
+        f"{config.SHARED_DIR}/logs:/kohakuriver-logs",
+        f"{config.LOCAL_TEMP_DIR}:/local_temp",
+    ]
+    for mount_spec in config.ADDITIONAL_MOUNTS:
+        mount_dirs.append(mount_spec)
+
+    # Add tunnel-client mount if available
+    tunnel_mount = get_tunnel_mount()
+    if tunnel_mount:
+        mount_dirs.append(tunnel_mount)
+
+    mount_args: list[str] = []
+    for mount in mount_dirs:
+        parts = mount.split(":")
+        if len(parts) < 2:
+            logger.warning(f"Invalid mount format: '{mount}'. Skipping.")
+            continue
+        host_path, container_path, *options = parts
+        option_str = ("," + ",".join(options)) if options else ""
+        mount_args.extend(
+            [
+                "--mount",
+                f"type=bind,source={host_path},target={container_path}{option_str}",
+            ]
+        )
+
+    _static_mount_args = (key, mount_args)
+    return mount_args
+
+
 def build_docker_run_command(
     task_id: int,
     docker_image_tag: str,
@@ -246,6 +711,7 @@ def build_docker_run_command(
     env_vars: dict[str, str],
     privileged: bool = False,
     reserved_ip: str | None = None,
+    detach: bool = False,
 ) -> list[str]:
     """
     Build a 'docker run --rm' command list for subprocess execution.
@@ -267,6 +733,8 @@ def build_docker_run_command(
         env_vars: Environment variables.
         privileged: Run in privileged mode.
         reserved_ip: Pre-reserved IP address for the container (optional).
+        detach: Add "-d" so the CLI exits once the container has started.
+            The exit code then comes from the container's 'die' event.
 
     Returns:
         Command list for subprocess execution.
@@ -284,96 +752,53 @@ def build_docker_run_command(
 
     container_name_full = task_container_name(task_id)
 
-    # Build docker run command
-    docker_cmd = ["docker", "run", "--rm"]
-
-    # Container name
-    docker_cmd.extend(["--name", container_name_full])
-
-    # Use overlay network if configured, otherwise kohakuriver-net bridge
-    # Containers on same node can communicate via container name
-    # With overlay, containers across nodes can communicate via overlay IPs
-    container_network = config.get_container_network()
-    docker_cmd.extend(["--network", container_network])
+    # Each optional flag is prebuilt as [] or [flag, value] and the argv is
+    # assembled in a single list display at the end
 
     # Assign specific IP if reserved
+    ip_args = []
     if reserved_ip:
-        docker_cmd.extend(["--ip", reserved_ip])
+        ip_args = ["--ip", reserved_ip]
         logger.info(f"[Task {task_id}] Using reserved IP: {reserved_ip}")
 
     # Privileged mode
     if privileged:
-        docker_cmd.append("--privileged")
+        cap_args = ["--privileged"]
         logger.warning(
             f"Task {task_id}: Running Docker container with --privileged flag!"
         )
     else:
-        docker_cmd.extend(["--cap-add", "SYS_NICE"])
-
-    # Mount directories
-    # shared_data subdirectory is mounted as /shared inside container
-    # logs directory is mounted as /kohakuriver-logs for task output
-    mount_dirs = [
-        f"{config.SHARED_DIR}/shared_data:/shared",
-        f"{config.SHARED_DIR}/logs:/kohakuriver-logs",
-        f"{config.LOCAL_TEMP_DIR}:/local_temp",
-    ]
-    for mount_spec in config.ADDITIONAL_MOUNTS:
-        mount_dirs.append(mount_spec)
-
-    # Add tunnel-client mount if available
-    tunnel_mount = get_tunnel_mount()
-    if tunnel_mount:
-        mount_dirs.append(tunnel_mount)
-
-    for mount in mount_dirs:
-        parts = mount.split(":")
-        if len(parts) < 2:
-            logger.warning(f"Invalid mount format: '{mount}'. Skipping.")
-            continue
-        host_path, container_path, *options = parts
-        option_str = ("," + ",".join(options)) if options else ""
-        docker_cmd.extend(
-            [
-                "--mount",
-                f"type=bind,source={host_path},target={container_path}{option_str}",
-            ]
-        )
+        cap_args = ["--cap-add", "SYS_NICE"]
 
     # Working directory
-    if working_dir:
-        docker_cmd.extend(["--workdir", working_dir])
+    workdir_args = ["--workdir", working_dir] if working_dir else []
 
     # CPU allocation
-    if required_cores > 0:
-        docker_cmd.extend(["--cpus", str(required_cores)])
+    cpu_args = ["--cpus", str(required_cores)] if required_cores > 0 else []
 
     # Memory limit
+    mem_args = []
     if required_memory_bytes and required_memory_bytes > 0:
         # Convert to MB for docker
         mem_mb = required_memory_bytes / (1024 * 1024)
-        docker_cmd.extend(["--memory", f"{mem_mb:.0f}m"])
+        mem_args = ["--memory", f"{mem_mb:.0f}m"]
 
     # GPU allocation
+    gpu_args = []
     if required_gpus:
         id_string = ",".join(str(g) for g in required_gpus)
-        docker_cmd.extend(["--gpus", f'"device={id_string}"'])
+        gpu_args = ["--gpus", f'"device={id_string}"']
 
-    # Environment variables
+    # Environment variables, plus tunnel variables if tunnel is enabled
+    env_args = []
     for key, value in env_vars.items():
-        docker_cmd.extend(["-e", f"{key}={value}"])
-
-    # Add tunnel environment variables if tunnel is enabled
-    tunnel_env = get_tunnel_env_vars(container_name_full)
-    for key, value in tunnel_env.items():
-        docker_cmd.extend(["-e", f"{key}={value}"])
-
-    # Add container image
-    docker_cmd.append(docker_image_tag)
+        env_args += ("-e", f"{key}={value}")
+    for key, value in get_tunnel_env_vars(container_name_full).items():
+        env_args += ("-e", f"{key}={value}")
 
     # Build the inner command (what runs inside the container)
     # Quote arguments for shell
-    quoted_args = [shlex.quote(arg) for arg in arguments]
+    quoted_args = [arg if _SHELL_SAFE(arg) else shlex.quote(arg) for arg in arguments]
     args_str = " ".join(quoted_args) if quoted_args else ""
 
     if numa_prefix:
@@ -382,8 +807,12 @@ def build_docker_run_command(
         inner_cmd = f"{command} {args_str}".strip()
 
     # Quote stdout/stderr paths for shell
-    quoted_stdout = shlex.quote(stdout_path)
-    quoted_stderr = shlex.quote(stderr_path)
+    quoted_stdout = (
+        stdout_path if _SHELL_SAFE(stdout_path) else shlex.quote(stdout_path)
+    )
+    quoted_stderr = (
+        stderr_path if _SHELL_SAFE(stderr_path) else shlex.quote(stderr_path)
+    )
 
     # Build shell command with redirection
     # Using 'exec' replaces the shell with our command, ensuring proper signal handling
@@ -392,10 +821,40 @@ def build_docker_run_command(
     # Wrap with tunnel-client startup if available
     shell_cmd = wrap_command_with_tunnel(shell_cmd, container_name_full, use_exec=True)
 
+    # Invariant: the final statement exec-replaces /bin/sh so the task command
+    # runs as PID 1 and receives `docker kill` signals directly
+    if not shell_cmd.startswith("exec ") and " && exec " not in shell_cmd:
+        logger.debug(f"[Task {task_id}] Shell command does not exec the task command")
+
     logger.debug(f"[Task {task_id}] Inner shell command: {shell_cmd}")
 
-    # Add shell wrapper
-    docker_cmd.extend(["/bin/sh", "-c", shell_cmd])
+    # Use overlay network if configured, otherwise kohakuriver-net bridge
+    # Containers on same node can communicate via container name
+    # With overlay, containers across nodes can communicate via overlay IPs
+    docker_cmd = [
+        "docker",
+        "run",
+        "--rm",
+        *(["-d"] if detach else []),
+        "--name",
+        container_name_full,
+        "--network",
+        config.get_container_network(),
+        *ip_args,
+        *cap_args,
+        # Mount directories (identical for every task, built once)
+        *_get_static_mount_args(),
+        *workdir_args,
+        *cpu_args,
+        *mem_args,
+        *gpu_args,
+        *env_args,
+        docker_image_tag,
+        # Shell wrapper
+        "/bin/sh",
+        "-c",
+        shell_cmd,
+    ]
 
     logger.debug(f"[Task {task_id}] Full docker command: {docker_cmd}")
 
@@ -479,6 +938,63 @@ async def _ensure_image_ready(
     return True
 
 
+def _container_log_path(host_path: str, logs_dir: str) -> str:
+    """
+    Translate a host log path under logs_dir to its /kohakuriver-logs path.
+
+    Container paths are always POSIX, so posixpath is used regardless of host.
+    Paths outside logs_dir are returned unchanged.
+    """
+    if not host_path.startswith(logs_dir + "/"):
+        logger.warning(f"Log path '{host_path}' is not under '{logs_dir}'")
+        return host_path
+    return posixpath.join("/kohakuriver-logs", posixpath.relpath(host_path, logs_dir))
+
+
+def invalidate_config_snapshot() -> None:
+    """
+    Drop per-task values derived from the runner config.
+
+    Call after changing config at runtime so the next task rebuilds the
+    mount arguments, NUMA prefixes and tunnel-client path. The 'docker run'
+    concurrency limit is kept: replacing its semaphore while startups hold
+    slots would let up to twice the limit run at once.
+    """
+    global _static_mount_args
+    _static_mount_args = None
+    _numa_prefix_cache.clear()
+    invalidate_tunnel_path()
+
+
+def _get_numa_prefix(numa_node_id: int | None, numa_topology: dict | None) -> str:
+    """Memoized get_numa_prefix; the prefix only changes with node or topology."""
+    if numa_node_id is None:
+        return ""
+    key = (numa_node_id, id(numa_topology), config.NUMACTL_PATH)
+    prefix = _numa_prefix_cache.get(key)
+    if prefix is None:
+        prefix = get_numa_prefix(numa_node_id, numa_topology)
+        _numa_prefix_cache[key] = prefix
+    return prefix
+
+
+def _ensure_output_dirs(*paths: str) -> None:
+    """
+    Create the parent directories of the given log file paths.
+
+    Directories already created by this runner are remembered so repeated
+    tasks logging to the same place skip the syscalls.
+    """
+    for path in paths:
+        directory = os.path.dirname(path)
+        if directory in _known_output_dirs:
+            continue
+        os.makedirs(directory, exist_ok=True)
+        if len(_known_output_dirs) >= _KNOWN_OUTPUT_DIRS_MAX:
+            _known_output_dirs.clear()
+        _known_output_dirs.add(directory)
+
+
 def _build_task_env(
     task_id: int,
     env_vars: dict[str, str],
@@ -577,7 +1093,9 @@ async def execute_task(
     logger.info(f"[Task {task_id}] Stdout: {stdout_path}")
     logger.info(f"[Task {task_id}] Stderr: {stderr_path}")
 
+    # Wall clock for the reported timestamps, monotonic clock for elapsed time
     start_time = datetime.datetime.now()
+    start_mono = time.monotonic()
     container_name_full = task_container_name(task_id)
 
     # Report pending status
@@ -594,13 +1112,15 @@ async def execute_task(
     logger.info(f"[Task {task_id}] Creating output directories...")
     logger.debug(f"[Task {task_id}]   stdout dir: {os.path.dirname(stdout_path)}")
     logger.debug(f"[Task {task_id}]   stderr dir: {os.path.dirname(stderr_path)}")
-    os.makedirs(os.path.dirname(stdout_path), exist_ok=True)
-    os.makedirs(os.path.dirname(stderr_path), exist_ok=True)
 
     # =========================================================================
-    # Step 1: Ensure Docker image is available
+    # Step 1: Ensure Docker image is available (overlapped with the mkdirs)
     # =========================================================================
-    if not await _ensure_image_ready(task_id, container_name, registry_image):
+    _, image_ready = await asyncio.gather(
+        asyncio.to_thread(_ensure_output_dirs, stdout_path, stderr_path),
+        _ensure_image_ready(task_id, container_name, registry_image),
+    )
+    if not image_ready:
         if registry_image:
             error_message = f"Failed to pull registry image '{registry_image}'"
         else:
@@ -628,16 +1148,16 @@ async def execute_task(
     logger.debug(f"[Task {task_id}] Environment variables: {list(task_env.keys())}")
 
     # Get NUMA prefix if applicable
-    numa_prefix = get_numa_prefix(target_numa_node_id, numa_topology)
+    numa_prefix = _get_numa_prefix(target_numa_node_id, numa_topology)
     logger.info(
         f"[Task {task_id}] NUMA prefix: {numa_prefix if numa_prefix else 'None'}"
     )
 
     # Convert host paths to container paths for stdout/stderr
     # Host path: {SHARED_DIR}/logs/... -> Container path: /kohakuriver-logs/...
-    logs_dir = os.path.join(config.SHARED_DIR, "logs")
-    container_stdout_path = stdout_path.replace(logs_dir, "/kohakuriver-logs", 1)
-    container_stderr_path = stderr_path.replace(logs_dir, "/kohakuriver-logs", 1)
+    logs_dir = posixpath.join(config.SHARED_DIR, "logs")
+    container_stdout_path = _container_log_path(stdout_path, logs_dir)
+    container_stderr_path = _container_log_path(stderr_path, logs_dir)
     logger.debug(f"[Task {task_id}] Container stdout path: {container_stdout_path}")
     logger.debug(f"[Task {task_id}] Container stderr path: {container_stderr_path}")
 
@@ -648,6 +1168,10 @@ async def execute_task(
         docker_image_tag = image_tag(container_name)
     logger.debug(f"[Task {task_id}] Docker image tag: {docker_image_tag}")
 
+    # With the event watcher connected the container is started detached and
+    # its exit comes from the shared event stream instead of the CLI process
+    detach = _exit_stream_live
+
     # Build the docker run command
     docker_cmd = build_docker_run_command(
         task_id=task_id,
@@ -664,6 +1188,7 @@ async def execute_task(
         env_vars=task_env,
         privileged=config.TASKS_PRIVILEGED,
         reserved_ip=reserved_ip,
+        detach=detach,
     )
 
     logger.info(f"[Task {task_id}] Step 2 complete: Task configuration built")
@@ -676,6 +1201,12 @@ async def execute_task(
     try:
         # Store task state BEFORE starting the container
         logger.debug(f"[Task {task_id}] Storing task state in task_store...")
+        kill_event = _kill_events[task_id] = asyncio.Event()
+        exit_future = None
+        if detach:
+            # Registered before the container starts so its 'die' can't be missed
+            exit_future = asyncio.get_running_loop().create_future()
+            _exit_futures[container_name_full] = exit_future
         task_store.add_task(
             task_id=task_id,
             container_name=container_name_full,
@@ -698,25 +1229,51 @@ async def execute_task(
             f"[Task {task_id}] Starting subprocess: {' '.join(shlex.quote(c) for c in docker_cmd[:10])}..."
         )
 
-        # Run the docker command via async subprocess
-        process = await asyncio.create_subprocess_exec(
-            *docker_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        logger.debug(f"[Task {task_id}] Subprocess PID: {process.pid}")
+        # Run the docker command via async subprocess. Only the startup window
+        # is bounded by the semaphore, so long-running tasks don't hold a slot.
+        async with _get_docker_run_semaphore():
+            # Task output goes to files via in-container redirection; the CLI's
+            # own stdout is just noise, so only stderr is captured for errors
+            process = await asyncio.create_subprocess_exec(
+                *docker_cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            logger.debug(f"[Task {task_id}] Subprocess PID: {process.pid}")
+            await _wait_container_started(process, container_name_full)
 
         logger.info(f"[Task {task_id}] Container started, waiting for completion...")
 
-        # Wait for process to finish
-        stdout_data, stderr_data = await process.communicate()
-        exit_code = process.returncode
+        async def wait_for_exit() -> tuple[int, bytes | None]:
+            _, stderr = await process.communicate()
+            if exit_future is None or process.returncode != 0:
+                # Attached run, or the detached run failed to start
+                return process.returncode, stderr
+            return await _wait_detached_exit(container_name_full, exit_future), stderr
+
+        # Wait for the container to exit, or for kill_tasks to signal an
+        # external kill, whichever comes first
+        wait_task = asyncio.create_task(wait_for_exit())
+        kill_wait = asyncio.create_task(kill_event.wait())
+        await asyncio.wait({wait_task, kill_wait}, return_when=asyncio.FIRST_COMPLETED)
+        kill_wait.cancel()
+
+        if not wait_task.done():
+            logger.info(
+                f"[Task {task_id}] Task was killed by host. Skipping status report."
+            )
+            # Give docker a moment to tear the container down; the pipe reader
+            # keeps running in the background if it takes longer
+            await asyncio.wait({wait_task}, timeout=KILL_CLEANUP_SECONDS)
+            elapsed = time.monotonic() - start_mono
+            logger.info(
+                f"[Task {task_id}] ========== TASK KILLED EXTERNALLY ({elapsed:.2f}s) =========="
+            )
+            return
+
+        exit_code, stderr_data = wait_task.result()
 
         logger.info(f"[Task {task_id}] Container finished with exit code: {exit_code}")
-        if stdout_data:
-            logger.debug(
-                f"[Task {task_id}] Docker stdout: {stdout_data.decode(errors='replace').strip()}"
-            )
         if stderr_data:
             logger.debug(
                 f"[Task {task_id}] Docker stderr: {stderr_data.decode(errors='replace').strip()}"
@@ -731,7 +1288,7 @@ async def execute_task(
                 f"[Task {task_id}] Task was removed from store (likely killed by host). "
                 "Skipping status report."
             )
-            elapsed = (datetime.datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_mono
             logger.info(
                 f"[Task {task_id}] ========== TASK KILLED EXTERNALLY ({elapsed:.2f}s) =========="
             )
@@ -761,7 +1318,7 @@ async def execute_task(
             )
         )
 
-        elapsed = (datetime.datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_mono
         logger.info(
             f"[Task {task_id}] ========== TASK EXECUTION COMPLETED ({elapsed:.2f}s) =========="
         )
@@ -771,50 +1328,114 @@ async def execute_task(
         await _report_task_failure(
             task_id, f"Task execution failed: {e}", start_time, task_store
         )
+    finally:
+        _kill_events.pop(task_id, None)
+        exit_future = _exit_futures.pop(container_name_full, None)
+        if exit_future is not None:
+            exit_future.cancel()
 
 
-def kill_task(
-    task_id: int,
-    container_name: str,
+async def _container_action(container_name: str, action: str) -> tuple[bool, str]:
+    """
+    Apply a lifecycle action (kill, pause, unpause) to a container.
+
+    Uses the Docker Engine API over the local socket, falling back to the
+    docker CLI when the socket is not available.
+
+    Args:
+        container_name: Docker container name.
+        action: Docker action ("kill", "pause" or "unpause").
+
+    Returns:
+        (success, error_message). error_message is empty on success.
+    """
+    client = engine_api.get_engine_client()
+    if client is not None:
+        return await engine_api.container_action(client, container_name, action)
+
+    result = await asyncio.to_thread(
+        _run_docker_command, ["docker", action, container_name], check=False
+    )
+    return result.returncode == 0, result.stderr
+
+
+async def kill_tasks(
+    tasks: list[tuple[int, str]],
     task_store: TaskStateStore,
 ) -> bool:
     """
-    Kill a running task.
+    Kill several running tasks at once.
+
+    With the Engine API the kills are issued concurrently; with the CLI
+    fallback all containers are killed by a single 'docker kill' invocation.
 
     Args:
-        task_id: Task ID to kill.
-        container_name: Docker container name (e.g., kohakuriver-task-123 or kohakuriver-vps-123).
+        tasks: (task_id, container_name) pairs to kill.
         task_store: Task state store.
 
     Returns:
-        True if kill was successful, False otherwise.
+        True if the tasks were removed from tracking, False otherwise.
     """
-    logger.debug(f"kill_task called: task_id={task_id}, container={container_name}")
+    if not tasks:
+        return True
+    task_ids = [task_id for task_id, _ in tasks]
+    names = [container_name for _, container_name in tasks]
+    logger.debug(f"kill_tasks called: task_ids={task_ids}, containers={names}")
 
     try:
         # Remove from tracking FIRST (so execute_task knows not to report status)
-        logger.debug(f"Removing task {task_id} from task_store...")
-        task_store.remove_task(task_id)
-
-        # Kill the container using docker kill
-        logger.debug(f"Killing container {container_name}...")
-        result = _run_docker_command(["docker", "kill", container_name], check=False)
-
-        if result.returncode == 0:
-            logger.info(f"Killed task {task_id}")
-            return True
+        logger.debug(f"Removing tasks {task_ids} from task_store...")
+        for task_id in task_ids:
+            task_store.remove_task(task_id)
+            kill_event = _kill_events.get(task_id)
+            if kill_event is not None:
+                kill_event.set()
+
+        # Kill the containers
+        logger.debug(f"Killing containers {names}...")
+        client = engine_api.get_engine_client()
+        if client is not None:
+            results = await asyncio.gather(
+                *(engine_api.container_action(client, name, "kill") for name in names)
+            )
+            errors = [error for success, error in results if not success]
         else:
-            logger.warning(
-                f"docker kill returned {result.returncode} for task {task_id}: {result.stderr}"
+            result = await asyncio.to_thread(
+                _run_docker_command, ["docker", "kill", *names], check=False
             )
-            return True  # Still return True since task was removed from tracking
+            errors = [result.stderr] if result.returncode != 0 else []
+
+        if errors:
+            logger.warning(f"docker kill failed for tasks {task_ids}: {errors}")
+        else:
+            logger.info(f"Killed tasks {task_ids}")
+        return True  # Tasks were removed from tracking either way
 
     except Exception as e:
-        logger.error(f"Failed to kill task {task_id}: {e}")
+        logger.error(f"Failed to kill tasks {task_ids}: {e}")
         return False
 
 
-def pause_task(
+async def kill_task(
+    task_id: int,
+    container_name: str,
+    task_store: TaskStateStore,
+) -> bool:
+    """
+    Kill a running task.
+
+    Args:
+        task_id: Task ID to kill.
+        container_name: Docker container name (e.g., kohakuriver-task-123 or kohakuriver-vps-123).
+        task_store: Task state store.
+
+    Returns:
+        True if kill was successful, False otherwise.
+    """
+    return await kill_tasks([(task_id, container_name)], task_store)
+
+
+async def pause_task(
     task_id: int,
     container_name: str,
     task_store: TaskStateStore,
@@ -833,13 +1454,13 @@ def pause_task(
     logger.debug(f"pause_task called: task_id={task_id}, container={container_name}")
 
     try:
-        result = _run_docker_command(["docker", "pause", container_name], check=False)
+        success, error = await _container_action(container_name, "pause")
 
-        if result.returncode == 0:
+        if success:
             logger.info(f"Paused task {task_id}")
             return True
         else:
-            logger.error(f"Failed to pause task {task_id}: {result.stderr}")
+            logger.error(f"Failed to pause task {task_id}: {error}")
             return False
 
     except Exception as e:
@@ -847,7 +1468,7 @@ def pause_task(
         return False
 
 
-def resume_task(
+async def resume_task(
     task_id: int,
     container_name: str,
     task_store: TaskStateStore,
@@ -866,13 +1487,13 @@ def resume_task(
     logger.debug(f"resume_task called: task_id={task_id}, container={container_name}")
 
     try:
-        result = _run_docker_command(["docker", "unpause", container_name], check=False)
+        success, error = await _container_action(container_name, "unpause")
 
-        if result.returncode == 0:
+        if success:
             logger.info(f"Resumed task {task_id}")
             return True
         else:
-            logger.error(f"Failed to resume task {task_id}: {result.stderr}")
+            logger.error(f"Failed to resume task {task_id}: {error}")
             return False
 
     except Exception as e:
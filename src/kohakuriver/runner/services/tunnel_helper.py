@@ -6,6 +6,8 @@ The tunnel client runs as a background daemon alongside the main process,
 enabling port forwarding without Docker port mapping.
 """
 
+import functools
+
 from kohakuriver.runner.config import config
 from kohakuriver.utils.logger import get_logger
 
@@ -17,6 +19,34 @@ TUNNEL_CLIENT_CONTAINER_PATH = "/usr/local/bin/tunnel-client"
 # Path for tunnel client logs inside container
 TUNNEL_LOG_PATH = "/tmp/tunnel-client.log"
 
+# Tunnel startup command, the same for every container
+# - Uses environment variables set via Docker -e flags
+# - Runs in background with nohup
+# - Logs to file for debugging
+_TUNNEL_START = (
+    f"(nohup {TUNNEL_CLIENT_CONTAINER_PATH} "
+    f'--runner-url "$KOHAKURIVER_TUNNEL_URL" '
+    f'--container-id "$KOHAKURIVER_CONTAINER_ID" '
+    f"--log-level info "
+    f"> {TUNNEL_LOG_PATH} 2>&1 &) && sleep 0.1"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _tunnel_path() -> str | None:
+    """Resolved tunnel-client path (None if disabled or not found), cached."""
+    return config.get_tunnel_client_path()
+
+
+def invalidate_tunnel_path() -> None:
+    """
+    Forget the cached tunnel-client path.
+
+    Call after changing TUNNEL_ENABLED/TUNNEL_CLIENT_PATH at runtime or
+    installing the binary, so the next container launch searches again.
+    """
+    _tunnel_path.cache_clear()
+
 
 def get_tunnel_mount() -> str | None:
     """
@@ -26,7 +56,7 @@ def get_tunnel_mount() -> str | None:
         Mount spec string like "host_path:/usr/local/bin/tunnel-client:ro"
         or None if tunnel is disabled or binary not found.
     """
-    tunnel_path = config.get_tunnel_client_path()
+    tunnel_path = _tunnel_path()
     if not tunnel_path:
         if config.TUNNEL_ENABLED:
             logger.warning(
@@ -67,7 +97,9 @@ def wrap_command_with_tunnel(
     Wrap a shell command to start tunnel-client as a background daemon.
 
     The tunnel client starts first, then the main command runs.
-    For task containers (use_exec=True), we use exec to replace the shell.
+    For task containers (use_exec=True), the main command is guaranteed to be
+    exec'd as the final statement so it replaces the shell and becomes PID 1
+    (no idle shell per container, signals from `docker kill` reach it directly).
     For VPS containers (use_exec=False), the main process stays as is.
 
     Args:
@@ -78,30 +110,17 @@ def wrap_command_with_tunnel(
     Returns:
         Modified shell command with tunnel startup.
     """
-    if not config.TUNNEL_ENABLED or not config.get_tunnel_client_path():
-        return shell_cmd
+    if use_exec and not shell_cmd.startswith("exec "):
+        shell_cmd = f"exec {shell_cmd}"
 
-    # Build tunnel startup command
-    # - Uses environment variables set via Docker -e flags
-    # - Runs in background with nohup
-    # - Logs to file for debugging
-    tunnel_start = (
-        f"(nohup {TUNNEL_CLIENT_CONTAINER_PATH} "
-        f'--runner-url "$KOHAKURIVER_TUNNEL_URL" '
-        f'--container-id "$KOHAKURIVER_CONTAINER_ID" '
-        f"--log-level info "
-        f"> {TUNNEL_LOG_PATH} 2>&1 &) && sleep 0.1"
-    )
+    if _tunnel_path() is None:
+        return shell_cmd
 
     # Combine: start tunnel in background, then run main command
-    if use_exec:
-        # For tasks: tunnel starts, then exec replaces shell with main process
-        return f"{tunnel_start} && {shell_cmd}"
-    else:
-        # For VPS: tunnel starts, then main process runs (no exec needed)
-        return f"{tunnel_start} && {shell_cmd}"
+    # (for tasks shell_cmd starts with exec, replacing the shell)
+    return f"{_TUNNEL_START} && {shell_cmd}"
 
 
 def is_tunnel_available() -> bool:
     """Check if tunnel client is available for use."""
-    return config.TUNNEL_ENABLED and config.get_tunnel_client_path() is not None
+    return _tunnel_path() is not None
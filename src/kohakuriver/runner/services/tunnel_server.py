@@ -7,11 +7,16 @@ through which multiple port forward connections are multiplexed.
 """
 
 import asyncio
+import collections
+import functools
+import ipaddress
+import itertools
+import socket
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from kohakuriver.runner.config import config
 from kohakuriver.storage.vault import TaskStateStore
-from kohakuriver.tunnel import protocol as proto_mod
 from kohakuriver.tunnel.protocol import (
     HEADER_SIZE,
     MSG_CLOSE,
@@ -19,15 +24,16 @@ from kohakuriver.tunnel.protocol import (
     MSG_CONNECTED,
     MSG_DATA,
     MSG_ERROR,
-    MSG_PING,
     MSG_PONG,
     PROTO_TCP,
     PROTO_UDP,
     build_message,
-    get_payload,
-    parse_header,
+    build_message_into,
+    get_payload_view,
+    unpack_client_id,
+    unpack_header,
 )
-from kohakuriver.utils.logger import get_logger
+from kohakuriver.utils.logger import get_logger, is_level_enabled
 
 logger = get_logger(__name__)
 
@@ -36,6 +42,35 @@ _task_store: TaskStateStore | None = None
 
 VM_CONTAINER_PREFIX = "vm-"
 
+# Messages a host/CLI WebSocket may have queued before its clients are dropped
+USER_SEND_QUEUE_SIZE = 1024
+
+# Messages queued towards a container's tunnel-client before senders block
+CONTAINER_SEND_QUEUE_SIZE = 256
+
+# Bytes buffered towards a VM socket before DATA writes wait for it to drain
+VM_WRITE_HIGH_WATER = 256 * 1024
+
+# Bytes a VM forward session may queue towards the host/CLI before VM reads
+# pause (a few TUNNEL_VM_READ_CHUNK frames)
+VM_SEND_QUEUE_BYTES = 1024 * 1024
+
+# MSG_ERROR payload prefix for failed VM connects
+_CONNECT_FAILED_PREFIX = b"Connection failed: "
+
+# Per-frame trace logging of forwarded DATA (very verbose, off by default)
+_TRACE = False
+
+# Message type names for logging, indexed by msg_type
+_MSG_NAMES = ("?", "CONNECT", "CONNECTED", "DATA", "CLOSE", "ERROR", "PING", "PONG")
+
+
+def _msg_name(msg_type: int) -> str:
+    """Get the log name of a message type."""
+    if 0 < msg_type < len(_MSG_NAMES):
+        return _MSG_NAMES[msg_type]
+    return f"UNKNOWN({msg_type})"
+
 
 def set_dependencies(task_store: TaskStateStore):
     """Set module dependencies from app startup."""
@@ -43,6 +78,147 @@ def set_dependencies(task_store: TaskStateStore):
     _task_store = task_store
 
 
+# =============================================================================
+# WebSocket Sender
+# =============================================================================
+
+
+class WebSocketSender:
+    """
+    Serializes outgoing binary messages on a WebSocket through one writer task.
+
+    Producers append to a deque and resolve a Future to wake the writer,
+    which drains everything queued since its last wakeup in one pass. This
+    skips the per-message bookkeeping of asyncio.Queue. Each message is
+    still its own WebSocket frame: the tunnel protocol has no length field,
+    so peers expect exactly one message per frame.
+
+    The buffer is bounded: send_nowait() reports overflow so callers can shed
+    the connection, while send() waits for room (backpressure). A forced
+    send_nowait() goes past the bound, for the final CLOSE of a connection.
+    """
+
+    def __init__(
+        self,
+        ws: WebSocket,
+        name: str,
+        maxsize: int = USER_SEND_QUEUE_SIZE,
+        max_bytes: int | None = None,
+    ):
+        """
+        Initialize the sender.
+
+        Args:
+            ws: WebSocket to write to
+            name: Label used in log messages
+            maxsize: Maximum number of queued messages
+            max_bytes: Maximum number of queued bytes (None for no limit)
+        """
+        self.ws = ws
+        self._name = name
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._queued_bytes = 0
+        self._buffer: collections.deque[bytes] = collections.deque()
+        self._wakeup: asyncio.Future | None = None
+        self._room = asyncio.Event()
+        self._room.set()
+        self._task: asyncio.Task | None = None
+        self.closed = False
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the writer task, dropping anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def send_nowait(self, data: bytes, force: bool = False) -> bool:
+        """
+        Queue a message without waiting.
+
+        Args:
+            data: Message to queue
+            force: Queue it even if the queue is full
+
+        Returns:
+            False if the queue is full or the WebSocket has failed
+        """
+        if self.closed or (self._full() and not force):
+            return False
+        self._buffer.append(data)
+        self._queued_bytes += len(data)
+        self._wake()
+        return True
+
+    async def send(self, data: bytes) -> bool:
+        """
+        Queue a message, waiting for room in the queue.
+
+        Returns:
+            False if the WebSocket has failed
+        """
+        while self._full() and not self.closed:
+            self._room.clear()
+            await self._room.wait()
+        if self.closed:
+            return False
+        self._buffer.append(data)
+        self._queued_bytes += len(data)
+        self._wake()
+        return True
+
+    def _full(self) -> bool:
+        """Check whether the queue has reached its message or byte limit."""
+        if len(self._buffer) >= self._maxsize:
+            return True
+        return self._max_bytes is not None and self._queued_bytes >= self._max_bytes
+
+    def _wake(self) -> None:
+        """Resolve the writer's wakeup future if it is waiting."""
+        wakeup = self._wakeup
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    async def _run(self) -> None:
+        """Writer loop: send queued messages in order."""
+        buffer = self._buffer
+        room = self._room
+        send_bytes = self.ws.send_bytes
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                if not buffer:
+                    self._wakeup = loop.create_future()
+                    await self._wakeup
+                    self._wakeup = None
+                # Drain the backlog without going back through the scheduler
+                while buffer:
+                    data = buffer.popleft()
+                    self._queued_bytes -= len(data)
+                    if not room.is_set():
+                        room.set()
+                    await send_bytes(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[{self._name}] WebSocket send failed: {e}")
+        finally:
+            self.closed = True
+            buffer.clear()
+            self._queued_bytes = 0
+            # Release producers blocked in send()
+            room.set()
+
+
 # =============================================================================
 # Container Tunnel
 # =============================================================================
@@ -65,155 +241,234 @@ class ContainerTunnel:
         """
         self.container_id = container_id
         self.ws = ws
-        self._next_client_id = 1
-        self._lock = asyncio.Lock()
+        self._sender = WebSocketSender(
+            ws, f"Tunnel {container_id}", CONTAINER_SEND_QUEUE_SIZE
+        )
+        self._client_ids = itertools.count(1)
+
+        # Map client_id -> sender for the user's WebSocket connection
+        self._user_connections: dict[int, WebSocketSender] = {}
+
+        # Container-bound sends waiting for queue room off the read loop
+        self._pending_sends: set[asyncio.Task] = set()
+
+        # Container message handlers by msg_type
+        forward = self._forward_to_user
+        forward_and_remove = functools.partial(forward, remove=True)
+        self._handlers = {
+            MSG_CONNECTED: forward,
+            MSG_DATA: forward,
+            MSG_CLOSE: forward_and_remove,
+            MSG_ERROR: forward_and_remove,
+            MSG_PONG: self._on_pong,
+        }
+
+    def start(self) -> None:
+        """Start the writer task for messages to the container."""
+        self._sender.start()
 
-        # Map client_id -> user's WebSocket connection
-        self._user_connections: dict[int, WebSocket] = {}
+    async def close(self) -> None:
+        """Stop the writer task for messages to the container."""
+        await self._sender.stop()
 
-    async def allocate_client_id(self) -> int:
+    def allocate_client_id(self) -> int:
         """Allocate a unique client ID for a new connection."""
-        async with self._lock:
-            client_id = self._next_client_id
-            self._next_client_id += 1
-            return client_id
+        return next(self._client_ids)
 
-    async def register_user_connection(
-        self, client_id: int, user_ws: WebSocket
+    def register_user_connection(
+        self, client_id: int, user_sender: WebSocketSender
     ) -> None:
-        """Register a user's WebSocket for receiving data."""
-        self._user_connections[client_id] = user_ws
+        """Register the sender of a user's WebSocket for receiving data."""
+        self._user_connections[client_id] = user_sender
 
-    async def unregister_user_connection(self, client_id: int) -> None:
+    def unregister_user_connection(self, client_id: int) -> None:
         """Unregister a user's WebSocket."""
         self._user_connections.pop(client_id, None)
 
+    def has_client(self, client_id: int, user_sender: WebSocketSender) -> bool:
+        """Check if a client ID is registered to the given user sender."""
+        return self._user_connections.get(client_id) is user_sender
+
+    def unregister_user_clients(self, user_sender: WebSocketSender) -> list[int]:
+        """
+        Unregister every client of a user's WebSocket.
+
+        Returns:
+            The client IDs that were still registered
+        """
+        client_ids = [
+            client_id
+            for client_id, registered in self._user_connections.items()
+            if registered is user_sender
+        ]
+        for client_id in client_ids:
+            del self._user_connections[client_id]
+        return client_ids
+
+    def _drop_user_client(self, proto: int, client_id: int) -> None:
+        """
+        Drop a client whose user WebSocket is backed up or has failed.
+
+        Both sides are told to close the connection: the container so it stops
+        producing, the user (past the queue bound) so its local connection
+        ends. If the container queue is full, the CLOSE waits for room in a
+        separate task so the read loop keeps going.
+
+        All clients of one user WebSocket share its send queue, so a single
+        bulk client filling it can get its sibling clients dropped as well.
+        """
+        logger.warning(
+            f"[Tunnel {self.container_id}] User connection for client_id={client_id} "
+            "is not draining, closing it"
+        )
+        user_sender = self._user_connections.pop(client_id, None)
+        close_msg = build_message(MSG_CLOSE, proto, client_id)
+        if user_sender is not None:
+            user_sender.send_nowait(close_msg, force=True)
+        if not self._sender.send_nowait(close_msg) and not self._sender.closed:
+            task = asyncio.create_task(self.send_to_container(close_msg))
+            self._pending_sends.add(task)
+            task.add_done_callback(self._pending_sends.discard)
+
     async def send_to_container(self, data: bytes) -> bool:
         """
-        Send data to the container via tunnel.
+        Queue data for the container via tunnel.
+
+        Waits while the send queue is full, so a slow tunnel-client pushes
+        back on the user connections feeding it.
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued, False if the tunnel WebSocket has failed
         """
-        try:
-            await self.ws.send_bytes(data)
+        if await self._sender.send(data):
             return True
-        except Exception as e:
-            logger.error(f"[Tunnel {self.container_id}] Failed to send: {e}")
-            return False
+        logger.error(f"[Tunnel {self.container_id}] Failed to send: tunnel closed")
+        return False
+
+    async def send_many_to_container(self, messages: list[bytes]) -> bool:
+        """
+        Queue several messages for the container in one go.
+
+        Only waits when the send queue fills up, so the writer picks the
+        whole batch up in a single drain pass.
 
-    async def handle_container_message(self, data: bytes) -> None:
+        Returns:
+            True if all were queued, False if the tunnel WebSocket has failed
+        """
+        sender = self._sender
+        for data in messages:
+            if not sender.send_nowait(data) and not await sender.send(data):
+                logger.error(
+                    f"[Tunnel {self.container_id}] Failed to send: tunnel closed"
+                )
+                return False
+        return True
+
+    def handle_container_message(self, data: bytes) -> None:
         """
         Handle a message received from the container.
 
         Routes data to the appropriate user WebSocket based on client_id.
+        Never waits on a user WebSocket: messages go onto each user's send
+        queue, so one slow user cannot stall the container read loop.
         """
-        header = parse_header(data)
-        if not header:
+        debug = is_level_enabled("DEBUG")
+
+        # DATA dominates tunnel traffic: route it by client_id alone, leaving
+        # unknown clients and full user queues to the general path below
+        if not debug and len(data) >= HEADER_SIZE and data[0] == MSG_DATA:
+            user_sender = self._user_connections.get(unpack_client_id(data))
+            if user_sender is not None and user_sender.send_nowait(data):
+                return
+
+        fields = unpack_header(data)
+        if fields is None:
             logger.warning(
                 f"[Tunnel {self.container_id}] Invalid message header (len={len(data)})"
             )
             return
+        msg_type, proto, client_id, port = fields
 
-        payload = get_payload(data)
+        # Runs for every frame: only format the message when it will be logged
+        if debug:
+            logger.debug(
+                f"[Tunnel {self.container_id}] Container→Runner: {_msg_name(msg_type)} "
+                f"client_id={client_id} port={port} payload_len={len(data) - HEADER_SIZE}"
+            )
 
-        msg_type_names = {
-            MSG_CONNECT: "CONNECT",
-            MSG_CONNECTED: "CONNECTED",
-            MSG_DATA: "DATA",
-            MSG_CLOSE: "CLOSE",
-            MSG_ERROR: "ERROR",
-            MSG_PING: "PING",
-            MSG_PONG: "PONG",
-        }
-        msg_name = msg_type_names.get(header.msg_type, f"UNKNOWN({header.msg_type})")
-        logger.info(
-            f"[Tunnel {self.container_id}] Container→Runner: {msg_name} "
-            f"client_id={header.client_id} port={header.port} payload_len={len(payload)}"
-        )
+        # Messages forwarded to the user get the full data (header + payload)
+        handler = self._handlers.get(msg_type)
+        if handler is None:
+            logger.warning(
+                f"[Tunnel {self.container_id}] Unknown message type: {msg_type}"
+            )
+            return
+        handler(msg_type, proto, client_id, data)
+
+    def _forward_to_user(
+        self,
+        msg_type: int,
+        proto: int,
+        client_id: int,
+        full_message: bytes,
+        remove: bool = False,
+    ) -> None:
+        """
+        Forward a CONNECTED/DATA/CLOSE/ERROR message to the user WebSocket.
 
-        # For messages that need to be forwarded to user, pass the full data (header + payload)
-        match header.msg_type:
-            case proto_mod.MSG_CONNECTED:
-                await self._on_connected(header, data)
-            case proto_mod.MSG_DATA:
-                await self._on_data(header, data)
-            case proto_mod.MSG_CLOSE:
-                await self._on_close(header, data)
-            case proto_mod.MSG_ERROR:
-                await self._on_error(header, data)
-            case proto_mod.MSG_PONG:
-                await self._on_pong(header, payload)
-            case _:
-                logger.warning(
-                    f"[Tunnel {self.container_id}] Unknown message type: {header.msg_type}"
-                )
+        CLOSE and ERROR end the connection, so the client is unregistered
+        (remove=True) before forwarding.
+        """
+        if remove:
+            user_sender = self._user_connections.pop(client_id, None)
+        else:
+            user_sender = self._user_connections.get(client_id)
+
+        if msg_type != MSG_DATA:
+            self._log_control_message(msg_type, proto, client_id, full_message)
+        elif _TRACE:
+            logger.debug(
+                f"[Tunnel {self.container_id}] Forwarding {len(full_message) - HEADER_SIZE} "
+                f"bytes to user for client_id={client_id}"
+            )
 
-    async def _on_connected(self, header, full_message: bytes) -> None:
-        """Handle CONNECTED message - forward to user."""
-        proto_name = "UDP" if header.proto == PROTO_UDP else "TCP"
-        logger.info(
-            f"[Tunnel {self.container_id}] Client {header.client_id} connected ({proto_name}), forwarding to user"
-        )
-        user_ws = self._user_connections.get(header.client_id)
-        if user_ws:
-            try:
-                await user_ws.send_bytes(full_message)
-            except Exception as e:
+        if user_sender is None:
+            if msg_type == MSG_DATA:
                 logger.warning(
-                    f"[Tunnel {self.container_id}] Failed to send CONNECTED to user: {e}"
+                    f"[Tunnel {self.container_id}] No user connection for client_id={client_id}"
                 )
+            return
+        # CLOSE and ERROR end the connection, so they may go past the bound
+        if not user_sender.send_nowait(full_message, force=remove) and not remove:
+            self._drop_user_client(proto, client_id)
 
-    async def _on_data(self, header, full_message: bytes) -> None:
-        """Handle DATA message - forward full message to user WebSocket."""
-        user_ws = self._user_connections.get(header.client_id)
-        if not user_ws:
+    def _log_control_message(
+        self, msg_type: int, proto: int, client_id: int, full_message: bytes
+    ) -> None:
+        """Log a CONNECTED/CLOSE/ERROR message from the container (cold path)."""
+        if msg_type == MSG_ERROR:
+            # The user gets the raw message; only decode it if it will be logged
+            if not is_level_enabled("WARNING"):
+                return
+            error_msg = str(get_payload_view(full_message), "utf-8", errors="replace")
             logger.warning(
-                f"[Tunnel {self.container_id}] No user connection for client_id={header.client_id}"
+                f"[Tunnel {self.container_id}] Client {client_id} error: {error_msg}"
             )
+        elif not is_level_enabled("DEBUG"):
             return
-        try:
-            payload_len = len(full_message) - HEADER_SIZE
-            logger.info(
-                f"[Tunnel {self.container_id}] Forwarding {payload_len} bytes to user for client_id={header.client_id}"
+        elif msg_type == MSG_CONNECTED:
+            proto_name = "UDP" if proto == PROTO_UDP else "TCP"
+            logger.debug(
+                f"[Tunnel {self.container_id}] Client {client_id} connected ({proto_name}), forwarding to user"
             )
-            await user_ws.send_bytes(full_message)
-        except Exception as e:
-            logger.warning(
-                f"[Tunnel {self.container_id}] Failed to send to user client_id={header.client_id}: {e}"
+        else:
+            logger.debug(
+                f"[Tunnel {self.container_id}] Client {client_id} closed by container"
             )
 
-    async def _on_close(self, header, full_message: bytes) -> None:
-        """Handle CLOSE message - forward to user and clean up."""
-        logger.info(
-            f"[Tunnel {self.container_id}] Client {header.client_id} closed by container"
-        )
-        user_ws = self._user_connections.pop(header.client_id, None)
-        if not user_ws:
-            return
-        try:
-            # Forward the CLOSE message to user so they know connection ended
-            await user_ws.send_bytes(full_message)
-        except Exception:
-            pass
-
-    async def _on_error(self, header, full_message: bytes) -> None:
-        """Handle ERROR message - forward to user and clean up."""
-        payload = get_payload(full_message)
-        error_msg = payload.decode("utf-8", errors="replace")
-        logger.warning(
-            f"[Tunnel {self.container_id}] Client {header.client_id} error: {error_msg}"
-        )
-        user_ws = self._user_connections.pop(header.client_id, None)
-        if not user_ws:
-            return
-        try:
-            # Forward the ERROR message to user
-            await user_ws.send_bytes(full_message)
-        except Exception:
-            pass
-
-    async def _on_pong(self, header, payload: bytes) -> None:
+    def _on_pong(
+        self, msg_type: int, proto: int, client_id: int, full_message: bytes
+    ) -> None:
         """Handle PONG message - keepalive response, ignore."""
         pass
 
@@ -236,11 +491,8 @@ class TunnelServer:
     def __init__(self):
         """Initialize tunnel server."""
         self._tunnels: dict[str, ContainerTunnel] = {}
-        self._lock = asyncio.Lock()
 
-    async def register_tunnel(
-        self, container_id: str, ws: WebSocket
-    ) -> ContainerTunnel:
+    def register_tunnel(self, container_id: str, ws: WebSocket) -> ContainerTunnel:
         """
         Register a new container tunnel.
 
@@ -251,24 +503,21 @@ class TunnelServer:
         Returns:
             The created ContainerTunnel instance
         """
-        async with self._lock:
-            # Close existing tunnel if any
-            if container_id in self._tunnels:
-                logger.warning(
-                    f"[TunnelServer] Replacing existing tunnel for {container_id}"
-                )
+        # Close existing tunnel if any
+        if container_id in self._tunnels:
+            logger.warning(
+                f"[TunnelServer] Replacing existing tunnel for {container_id}"
+            )
 
-            tunnel = ContainerTunnel(container_id, ws)
-            self._tunnels[container_id] = tunnel
-            logger.info(f"[TunnelServer] Registered tunnel for {container_id}")
-            return tunnel
+        tunnel = ContainerTunnel(container_id, ws)
+        self._tunnels[container_id] = tunnel
+        logger.info(f"[TunnelServer] Registered tunnel for {container_id}")
+        return tunnel
 
-    async def unregister_tunnel(self, container_id: str) -> None:
+    def unregister_tunnel(self, container_id: str) -> None:
         """Unregister a container tunnel."""
-        async with self._lock:
-            if container_id in self._tunnels:
-                del self._tunnels[container_id]
-                logger.info(f"[TunnelServer] Unregistered tunnel for {container_id}")
+        if self._tunnels.pop(container_id, None) is not None:
+            logger.info(f"[TunnelServer] Unregistered tunnel for {container_id}")
 
     def get_tunnel(self, container_id: str) -> ContainerTunnel | None:
         """Get a tunnel by container ID."""
@@ -302,18 +551,20 @@ async def handle_container_tunnel(websocket: WebSocket, container_id: str) -> No
     await websocket.accept()
     logger.info(f"[Tunnel] Container {container_id} connected")
 
-    tunnel = await tunnel_server.register_tunnel(container_id, websocket)
+    tunnel = tunnel_server.register_tunnel(container_id, websocket)
+    tunnel.start()
 
     try:
         while True:
             data = await websocket.receive_bytes()
-            await tunnel.handle_container_message(data)
+            tunnel.handle_container_message(data)
     except WebSocketDisconnect:
         logger.info(f"[Tunnel] Container {container_id} disconnected")
     except Exception as e:
         logger.error(f"[Tunnel] Container {container_id} error: {e}")
     finally:
-        await tunnel_server.unregister_tunnel(container_id)
+        tunnel_server.unregister_tunnel(container_id)
+        await tunnel.close()
 
 
 # =============================================================================
@@ -321,87 +572,79 @@ async def handle_container_tunnel(websocket: WebSocket, container_id: str) -> No
 # =============================================================================
 
 
+async def _pf_on_connect(
+    msg_type, client_id, port, payload, data, tunnel, sender, proto
+) -> None:
+    """Handle MSG_CONNECT: new connection request from CLI."""
+    logger.info(f"[Forward] CONNECT client_id={client_id} -> port={port}")
+
+    # Register this websocket to receive responses for this client_id
+    # before the container can answer
+    tunnel.register_user_connection(client_id, sender)
+
+    # Forward to container tunnel
+    if not await tunnel.send_to_container(data):
+        logger.error(
+            f"[Forward] Failed to send CONNECT to container for client_id={client_id}"
+        )
+        error_msg = build_message(MSG_ERROR, proto, client_id, 0, b"Tunnel send failed")
+        sender.send_nowait(error_msg)
+        tunnel.unregister_user_connection(client_id)
+
+
+async def _pf_on_close(
+    msg_type, client_id, port, payload, data, tunnel, sender, proto
+) -> None:
+    """Handle MSG_CLOSE: close request from CLI."""
+    logger.info(f"[Forward] CLOSE client_id={client_id}")
+    tunnel.unregister_user_connection(client_id)
+    await tunnel.send_to_container(data)
+
+
+async def _pf_on_other(
+    msg_type, client_id, port, payload, data, tunnel, sender, proto
+) -> None:
+    """Forward unknown message types to the container as-is."""
+    logger.debug(f"[Forward] Forwarding unknown message type {msg_type}")
+    await tunnel.send_to_container(data)
+
+
+# Port forward message handlers by msg_type (anything else uses _pf_on_other);
+# MSG_DATA is handled inline in handle_port_forward
+_PF_HANDLERS = {
+    MSG_CONNECT: _pf_on_connect,
+    MSG_CLOSE: _pf_on_close,
+}
+
+
 async def _handle_pf_message(
     msg_type: int,
-    header,
-    payload: bytes,
+    client_id: int,
+    port: int,
+    payload: memoryview,
     data: bytes,
     tunnel: ContainerTunnel,
-    websocket: WebSocket,
-    active_clients: set[int],
+    sender: WebSocketSender,
     proto: int,
 ) -> None:
     """
     Handle a single multiplexed message in a port forward session.
 
-    Dispatches MSG_CONNECT, MSG_DATA, MSG_CLOSE, and unknown message types
-    to the appropriate handler logic.
+    Dispatches MSG_CONNECT, MSG_CLOSE, and unknown message types to the
+    appropriate handler logic (MSG_DATA is forwarded by the caller).
 
     Args:
         msg_type: The parsed message type
-        header: The parsed message header
-        payload: The message payload (data after header)
+        client_id: The parsed client ID
+        port: The parsed target port
+        payload: View of the message payload (data after header)
         data: The full raw message (header + payload)
         tunnel: The container tunnel to forward messages through
-        websocket: The host/CLI WebSocket connection
-        active_clients: Set of active client IDs for this session
+        sender: Sender for the host/CLI WebSocket connection
         proto: Protocol type (PROTO_TCP or PROTO_UDP)
     """
-    client_id = header.client_id
-    msg_port = header.port
-
-    match msg_type:
-        case proto_mod.MSG_CONNECT:
-            # New connection request from CLI
-            active_clients.add(client_id)
-            logger.info(f"[Forward] CONNECT client_id={client_id} -> port={msg_port}")
-
-            # Forward to container tunnel
-            logger.info(f"[Forward] Sending CONNECT to container tunnel...")
-            success = await tunnel.send_to_container(data)
-            logger.info(f"[Forward] CONNECT send_to_container result: {success}")
-            if not success:
-                logger.error(f"[Forward] Failed to send CONNECT to container")
-                error_msg = build_message(
-                    MSG_ERROR, proto, client_id, 0, b"Tunnel send failed"
-                )
-                await websocket.send_bytes(error_msg)
-                active_clients.discard(client_id)
-            else:
-                logger.info(
-                    f"[Forward] CONNECT sent to container, registering user connection"
-                )
-
-            # Register this websocket to receive responses for this client_id
-            await tunnel.register_user_connection(client_id, websocket)
-
-        case proto_mod.MSG_DATA:
-            # Data from CLI to container
-            if client_id not in active_clients:
-                logger.warning(f"[Forward] DATA for unknown client_id={client_id}")
-                return
-
-            logger.info(
-                f"[Forward] Forwarding {len(payload)} bytes to container tunnel for client_id={client_id}"
-            )
-            success = await tunnel.send_to_container(data)
-            logger.info(f"[Forward] send_to_container result: {success}")
-            if not success:
-                logger.warning(
-                    f"[Forward] Failed to send DATA for client_id={client_id}"
-                )
-
-        case proto_mod.MSG_CLOSE:
-            # Close request from CLI
-            logger.info(f"[Forward] CLOSE client_id={client_id}")
-            active_clients.discard(client_id)
-            await tunnel.unregister_user_connection(client_id)
-            await tunnel.send_to_container(data)
-
-        case _:
-            # Forward unknown message types
-            logger.debug(f"[Forward] Forwarding unknown message type {msg_type}")
-            await tunnel.send_to_container(data)
+    handler = _PF_HANDLERS.get(msg_type, _pf_on_other)
+    await handler(msg_type, client_id, port, payload, data, tunnel, sender, proto)
 
 
 async def handle_port_forward(
@@ -448,49 +691,57 @@ async def handle_port_forward(
 
     logger.info(f"[Forward] Found tunnel for container={container_id}")
 
-    # Track active client IDs for this session
-    active_clients: set[int] = set()
+    # All messages to the host/CLI go through one writer task
+    sender = WebSocketSender(websocket, f"Forward {container_id}")
 
     try:
         # Send CONNECTED to confirm tunnel is available
         await websocket.send_text("CONNECTED")
         logger.info(f"[Forward] Session established for {container_id}:{port}")
-
-        # Message type names for logging
-        msg_type_names = {
-            MSG_CONNECT: "CONNECT",
-            MSG_CONNECTED: "CONNECTED",
-            MSG_DATA: "DATA",
-            MSG_CLOSE: "CLOSE",
-            MSG_ERROR: "ERROR",
-        }
+        sender.start()
 
         # Handle multiplexed messages from host/CLI
         while True:
             data = await websocket.receive_bytes()
 
-            header = parse_header(data)
-            if not header:
-                logger.warning(f"[Forward] Invalid message header (len={len(data)})")
+            # Hot path: DATA goes to the container as-is, routed by client_id
+            # alone without unpacking the header or dispatching
+            if len(data) >= HEADER_SIZE and data[0] == MSG_DATA:
+                client_id = unpack_client_id(data)
+                # Runs for every frame: only format the message when it will be logged
+                if is_level_enabled("DEBUG"):
+                    logger.debug(
+                        f"[Forward] Host→Runner: DATA client_id={client_id} "
+                        f"payload_len={len(data) - HEADER_SIZE}"
+                    )
+                if not tunnel.has_client(client_id, sender):
+                    logger.warning(f"[Forward] DATA for unknown client_id={client_id}")
+                elif not await tunnel.send_to_container(data):
+                    logger.warning(
+                        f"[Forward] Failed to send DATA for client_id={client_id}"
+                    )
                 continue
 
-            msg_type = header.msg_type
-            payload = get_payload(data)
+            fields = unpack_header(data)
+            if fields is None:
+                logger.warning(f"[Forward] Invalid message header (len={len(data)})")
+                continue
+            msg_type, _, client_id, msg_port = fields
 
-            msg_name = msg_type_names.get(msg_type, f"UNKNOWN({msg_type})")
-            logger.info(
-                f"[Forward] Host→Runner: {msg_name} client_id={header.client_id} "
-                f"port={header.port} payload_len={len(payload)}"
-            )
+            if is_level_enabled("DEBUG"):
+                logger.debug(
+                    f"[Forward] Host→Runner: {_msg_name(msg_type)} client_id={client_id} "
+                    f"port={msg_port} payload_len={len(data) - HEADER_SIZE}"
+                )
 
             await _handle_pf_message(
                 msg_type,
-                header,
-                payload,
+                client_id,
+                msg_port,
+                get_payload_view(data),
                 data,
                 tunnel,
-                websocket,
-                active_clients,
+                sender,
                 proto,
             )
 
@@ -499,11 +750,13 @@ async def handle_port_forward(
     except Exception as e:
         logger.error(f"[Forward] Error: {e}")
     finally:
-        # Clean up all active connections
-        for client_id in active_clients:
-            close_msg = build_message(MSG_CLOSE, proto, client_id)
-            await tunnel.send_to_container(close_msg)
-            await tunnel.unregister_user_connection(client_id)
+        # Clean up all active connections. The tunnel protocol allows only one
+        # message per frame, so the CLOSEs are batched at the queue instead.
+        client_ids = tunnel.unregister_user_clients(sender)
+        await tunnel.send_many_to_container(
+            [build_message(MSG_CLOSE, proto, client_id) for client_id in client_ids]
+        )
+        await sender.stop()
 
         logger.info(f"[Forward] Session closed (container={container_id})")
 
@@ -549,65 +802,151 @@ def _resolve_vm_target(
     return (task_id, vm_ip)
 
 
-async def _forward_vm_tcp_to_ws(
-    client_id: int,
-    reader: asyncio.StreamReader,
-    writer: asyncio.StreamWriter,
-    websocket: WebSocket,
-    stop_event: asyncio.Event,
-    active_connections: dict[
-        int, tuple[asyncio.StreamReader, asyncio.StreamWriter, asyncio.Task]
-    ],
-    proto: int = PROTO_TCP,
-) -> None:
+class _VMForwardProtocol(asyncio.BufferedProtocol):
     """
-    Read from a VM TCP connection and forward data to the WebSocket as MSG_DATA.
+    Bridges one VM TCP connection to the host/CLI WebSocket as MSG_DATA.
 
-    Runs as a background task for each active TCP connection. When the VM closes
-    the TCP connection or an error occurs, sends the appropriate protocol message
-    back through the WebSocket and cleans up.
+    The transport receives straight into a frame buffer whose MSG_DATA
+    header is written once, so each read becomes one WebSocket frame with
+    no read loop task per connection. Reading pauses while the WebSocket
+    send queue is full; write() waits while the VM is not keeping up.
+    """
 
-    Args:
-        client_id: The client connection identifier
-        reader: TCP stream reader connected to the VM
-        writer: TCP stream writer connected to the VM
-        websocket: The WebSocket connection to the host/CLI
-        stop_event: Event signalling that the session is shutting down
-        active_connections: Shared dict tracking all active TCP connections
-        proto: Protocol type (PROTO_TCP or PROTO_UDP)
+    def __init__(
+        self,
+        client_id: int,
+        proto: int,
+        sender: WebSocketSender,
+        active_connections: "_VMConnections",
+    ):
+        """
+        Initialize the protocol.
+
+        Args:
+            client_id: The client connection identifier
+            proto: Protocol type (PROTO_TCP or PROTO_UDP)
+            sender: Sender for the WebSocket connection to the host/CLI
+            active_connections: Shared dict tracking all active TCP connections
+        """
+        self.client_id = client_id
+        self._proto = proto
+        self._sender = sender
+        self._active_connections = active_connections
+        self._transport: asyncio.Transport | None = None
+        self._closing = False
+        self._resume_task: asyncio.Task | None = None
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+
+        # Larger reads mean fewer syscalls and frames for bulk transfers. The
+        # protocol has no length field, so frame size is bounded only by the
+        # peers' WebSocket max message size (1 MiB by default in websockets).
+        frame = bytearray(HEADER_SIZE + config.TUNNEL_VM_READ_CHUNK)
+        self._frame_view = memoryview(frame)
+        self._header_size = build_message_into(frame, MSG_DATA, proto, client_id, 0)
+        self._recv_view = self._frame_view[self._header_size :]
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+        transport.set_write_buffer_limits(high=VM_WRITE_HIGH_WATER)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._recv_view
+
+    def buffer_updated(self, nbytes: int) -> None:
+        frame = bytes(self._frame_view[: self._header_size + nbytes])
+        if self._sender.send_nowait(frame):
+            return
+        if self._sender.closed:
+            # Host/CLI WebSocket is gone
+            self.close()
+            return
+        # Send queue is full: stop reading until this frame is queued
+        self._transport.pause_reading()
+        self._resume_task = asyncio.create_task(self._send_and_resume(frame))
+
+    async def _send_and_resume(self, frame: bytes) -> None:
+        """Queue a frame that did not fit, then resume reading from the VM."""
+        if not await self._sender.send(frame):
+            self.close()
+        elif not self._transport.is_closing():
+            self._transport.resume_reading()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._active_connections.get(self.client_id) is self:
+            del self._active_connections[self.client_id]
+        self._can_write.set()
+        if self._closing:
+            return
+
+        if exc is None:
+            # TCP connection closed by VM
+            logger.debug(f"[VM Forward] VM closed TCP for client_id={self.client_id}")
+            message = build_message(MSG_CLOSE, self._proto, self.client_id, 0)
+        else:
+            logger.debug(f"[VM Forward] Read error client_id={self.client_id}: {exc}")
+            message = build_message(
+                MSG_ERROR, self._proto, self.client_id, 0, str(exc).encode()
+            )
+
+        # Keep it behind a DATA frame still waiting for queue room, and wait
+        # for room rather than dropping it
+        pending = self._resume_task
+        if (pending is None or pending.done()) and self._sender.send_nowait(message):
+            return
+        self._resume_task = asyncio.create_task(self._send_after(pending, message))
+
+    async def _send_after(self, pending: asyncio.Task | None, message: bytes) -> None:
+        """Queue a final CLOSE/ERROR once any pending DATA frame is queued."""
+        if pending is not None:
+            await asyncio.wait([pending])
+        await self._sender.send(message)
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    async def write(self, data: bytes | memoryview) -> None:
+        """Write data to the VM, waiting only while its write buffer is full."""
+        self._transport.write(data)
+        if not self._can_write.is_set():
+            await self._can_write.wait()
+
+    def close(self) -> None:
+        """Close the VM connection without reporting it back to the user."""
+        self._closing = True
+        if self._resume_task is not None:
+            self._resume_task.cancel()
+        self._transport.close()
+
+
+# Active VM TCP connections of a session: client_id -> protocol
+_VMConnections = dict[int, _VMForwardProtocol]
+
+
+async def _resolve_vm_address(
+    loop: asyncio.AbstractEventLoop, vm_ip: str, port: int
+) -> tuple[int, tuple]:
+    """
+    Get the socket family and address to connect to on a VM.
+
+    VM addresses are normally IP literals, which need no resolver round
+    trip; anything else goes through getaddrinfo.
+
+    Returns:
+        (family, address) tuple for socket() and sock_connect()
     """
     try:
-        while not stop_event.is_set():
-            data = await reader.read(65536)
-            if not data:
-                # TCP connection closed by VM
-                logger.debug(f"[VM Forward] VM closed TCP for client_id={client_id}")
-                close_msg = build_message(MSG_CLOSE, proto, client_id, 0)
-                try:
-                    await websocket.send_bytes(close_msg)
-                except Exception:
-                    pass
-                break
-
-            msg = build_message(MSG_DATA, proto, client_id, 0, data)
-            await websocket.send_bytes(msg)
-    except (ConnectionResetError, BrokenPipeError, asyncio.CancelledError):
-        pass
-    except Exception as e:
-        if not stop_event.is_set():
-            logger.debug(f"[VM Forward] Read error client_id={client_id}: {e}")
-            error_msg = build_message(MSG_ERROR, proto, client_id, 0, str(e).encode())
-            try:
-                await websocket.send_bytes(error_msg)
-            except Exception:
-                pass
-    finally:
-        # Clean up connection
-        try:
-            writer.close()
-        except Exception:
-            pass
-        active_connections.pop(client_id, None)
+        ip = ipaddress.ip_address(vm_ip)
+    except ValueError:
+        (family, _, _, _, address), *_ = await loop.getaddrinfo(
+            vm_ip, port, type=socket.SOCK_STREAM
+        )
+        return family, address
+    family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+    return family, (vm_ip, port)
 
 
 async def _handle_vm_connect(
@@ -615,35 +954,49 @@ async def _handle_vm_connect(
     vm_ip: str,
     msg_port: int,
     proto: int,
-    websocket: WebSocket,
-    active_connections: dict[
-        int, tuple[asyncio.StreamReader, asyncio.StreamWriter, asyncio.Task]
-    ],
-    stop_event: asyncio.Event,
+    sender: WebSocketSender,
+    active_connections: _VMConnections,
 ) -> None:
     """
     Handle a MSG_CONNECT for a VM port forward session.
 
-    Opens a direct TCP connection to the VM, starts a background task to
-    forward data from the VM back to the WebSocket, and sends a CONNECTED
-    response.
+    Opens a direct TCP connection to the VM, bridges it to the WebSocket
+    through a _VMForwardProtocol, and sends a CONNECTED response.
 
     Args:
         client_id: The client connection identifier
         vm_ip: The VM's IP address
         msg_port: The target port on the VM
         proto: Protocol type (PROTO_TCP or PROTO_UDP)
-        websocket: The WebSocket connection to the host/CLI
+        sender: Sender for the WebSocket connection to the host/CLI
         active_connections: Shared dict tracking all active TCP connections
-        stop_event: Event signalling that the session is shutting down
     """
     logger.info(f"[VM Forward] CONNECT client_id={client_id} -> {vm_ip}:{msg_port}")
+    loop = asyncio.get_running_loop()
+    sock = None
     try:
-        reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(vm_ip, msg_port),
-            timeout=10.0,
+        # Connect a raw socket first so its options apply before connect()
+        family, address = await _resolve_vm_address(loop, vm_ip, msg_port)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        # No Nagle delay for interactive traffic; buffers are sized before
+        # connecting so the receive window scale is negotiated from them
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if config.TUNNEL_VM_SOCKET_BUFFER > 0:
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, config.TUNNEL_VM_SOCKET_BUFFER
+            )
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, config.TUNNEL_VM_SOCKET_BUFFER
+            )
+        await asyncio.wait_for(loop.sock_connect(sock, address), timeout=10.0)
+        _, protocol = await loop.create_connection(
+            lambda: _VMForwardProtocol(client_id, proto, sender, active_connections),
+            sock=sock,
         )
     except Exception as e:
+        if sock is not None:
+            sock.close()
         logger.warning(
             f"[VM Forward] TCP connect failed for client_id={client_id}: {e}"
         )
@@ -652,55 +1005,31 @@ async def _handle_vm_connect(
             proto,
             client_id,
             msg_port,
-            f"Connection failed: {e}".encode(),
+            _CONNECT_FAILED_PREFIX + str(e).encode(errors="replace"),
         )
-        await websocket.send_bytes(error_msg)
+        sender.send_nowait(error_msg, force=True)
         return
 
-    # Start reading from VM in background
-    read_task = asyncio.create_task(
-        _forward_vm_tcp_to_ws(
-            client_id,
-            reader,
-            writer,
-            websocket,
-            stop_event,
-            active_connections,
-            proto,
-        )
-    )
-    active_connections[client_id] = (reader, writer, read_task)
+    active_connections[client_id] = protocol
 
-    # Send CONNECTED back
+    # Send CONNECTED back (past the bound: DATA of other clients may fill it)
     connected_msg = build_message(MSG_CONNECTED, proto, client_id, msg_port)
-    await websocket.send_bytes(connected_msg)
+    sender.send_nowait(connected_msg, force=True)
     logger.info(f"[VM Forward] TCP connected for client_id={client_id}")
 
 
-async def _cleanup_vm_connections(
-    active_connections: dict[
-        int, tuple[asyncio.StreamReader, asyncio.StreamWriter, asyncio.Task]
-    ],
-    stop_event: asyncio.Event,
-) -> None:
+def _cleanup_vm_connections(active_connections: _VMConnections) -> None:
     """
     Clean up all active VM TCP connections.
 
-    Sets the stop event to signal background read tasks to stop, cancels
-    all read tasks, and closes all TCP writers.
-
     Args:
         active_connections: Shared dict tracking all active TCP connections
-        stop_event: Event signalling that the session is shutting down
     """
-    stop_event.set()
-    for client_id, (_, writer, read_task) in active_connections.items():
-        read_task.cancel()
-        try:
-            writer.close()
-        except Exception:
-            pass
-    active_connections.clear()
+    # Closing is non-blocking: transports send their FINs from the loop, so
+    # there is nothing to await here
+    while active_connections:
+        _, protocol = active_connections.popitem()
+        protocol.close()
 
 
 # =============================================================================
@@ -708,19 +1037,58 @@ async def _cleanup_vm_connections(
 # =============================================================================
 
 
+async def _vm_on_connect(
+    client_id, msg_port, payload, vm_ip, proto, sender, active_connections
+) -> None:
+    """Handle MSG_CONNECT: open a TCP connection to the VM."""
+    await _handle_vm_connect(
+        client_id, vm_ip, msg_port, proto, sender, active_connections
+    )
+
+
+async def _vm_on_data(
+    client_id, msg_port, payload, vm_ip, proto, sender, active_connections
+) -> None:
+    """Handle MSG_DATA: forward data to the VM TCP connection."""
+    conn = active_connections.get(client_id)
+    if not conn:
+        logger.warning(f"[VM Forward] DATA for unknown client_id={client_id}")
+        return
+
+    try:
+        await conn.write(payload)
+    except Exception as e:
+        logger.warning(f"[VM Forward] TCP write failed client_id={client_id}: {e}")
+
+
+async def _vm_on_close(
+    client_id, msg_port, payload, vm_ip, proto, sender, active_connections
+) -> None:
+    """Handle MSG_CLOSE: close the VM TCP connection."""
+    logger.info(f"[VM Forward] CLOSE client_id={client_id}")
+    conn = active_connections.pop(client_id, None)
+    if conn:
+        conn.close()
+
+
+_VM_HANDLERS = {
+    MSG_DATA: _vm_on_data,
+    MSG_CONNECT: _vm_on_connect,
+    MSG_CLOSE: _vm_on_close,
+}
+
+
 async def _handle_vm_pf_message(
     msg_type: int,
-    header,
-    payload: bytes,
+    client_id: int,
+    msg_port: int,
+    payload: memoryview,
     data: bytes,
     port: int,
     vm_ip: str,
     proto: int,
-    websocket: WebSocket,
-    active_connections: dict[
-        int, tuple[asyncio.StreamReader, asyncio.StreamWriter, asyncio.Task]
-    ],
-    stop_event: asyncio.Event,
+    sender: WebSocketSender,
+    active_connections: _VMConnections,
 ) -> None:
     """
     Handle a single multiplexed message in a VM port forward session.
@@ -730,58 +1098,27 @@ async def _handle_vm_pf_message(
 
     Args:
         msg_type: The parsed message type
-        header: The parsed message header
-        payload: The message payload (data after header)
+        client_id: The parsed client ID
+        msg_port: The parsed target port (0 to use the session port)
+        payload: View of the message payload (data after header)
         data: The full raw message (header + payload)
         port: The default target port
         vm_ip: The VM's IP address
         proto: Protocol type (PROTO_TCP or PROTO_UDP)
-        websocket: The WebSocket connection to the host/CLI
+        sender: Sender for the WebSocket connection to the host/CLI
         active_connections: Shared dict tracking all active TCP connections
-        stop_event: Event signalling that the session is shutting down
     """
-    client_id = header.client_id
-    msg_port = header.port or port
-
-    match msg_type:
-        case proto_mod.MSG_CONNECT:
-            await _handle_vm_connect(
-                client_id,
-                vm_ip,
-                msg_port,
-                proto,
-                websocket,
-                active_connections,
-                stop_event,
-            )
-
-        case proto_mod.MSG_DATA:
-            # Forward data to VM TCP connection
-            conn = active_connections.get(client_id)
-            if not conn:
-                logger.warning(f"[VM Forward] DATA for unknown client_id={client_id}")
-                return
-
-            _, writer, _ = conn
-            try:
-                writer.write(payload)
-                await writer.drain()
-            except Exception as e:
-                logger.warning(
-                    f"[VM Forward] TCP write failed client_id={client_id}: {e}"
-                )
-
-        case proto_mod.MSG_CLOSE:
-            # Close TCP connection
-            logger.info(f"[VM Forward] CLOSE client_id={client_id}")
-            conn = active_connections.pop(client_id, None)
-            if conn:
-                _, writer, read_task = conn
-                read_task.cancel()
-                try:
-                    writer.close()
-                except Exception:
-                    pass
+    handler = _VM_HANDLERS.get(msg_type)
+    if handler is not None:
+        await handler(
+            client_id,
+            msg_port or port,
+            payload,
+            vm_ip,
+            proto,
+            sender,
+            active_connections,
+        )
 
 
 async def _handle_vm_port_forward(
@@ -823,39 +1160,42 @@ async def _handle_vm_port_forward(
         f"[VM Forward] New {proto_name} forward session: VM {task_id} ({vm_ip}), port={port}"
     )
 
-    # Track active TCP connections: client_id -> (reader, writer, read_task)
-    active_connections: dict[
-        int, tuple[asyncio.StreamReader, asyncio.StreamWriter, asyncio.Task]
-    ] = {}
-    stop_event = asyncio.Event()
+    # Track active TCP connections: client_id -> protocol
+    active_connections: _VMConnections = {}
+
+    # All messages to the host/CLI go through one writer task
+    sender = WebSocketSender(
+        websocket, f"VM Forward {task_id}", max_bytes=VM_SEND_QUEUE_BYTES
+    )
 
     try:
         # Send CONNECTED to confirm VM is available
         await websocket.send_text("CONNECTED")
         logger.info(f"[VM Forward] Session established for VM {task_id}:{port}")
+        sender.start()
 
         while True:
             data = await websocket.receive_bytes()
 
-            header = parse_header(data)
-            if not header:
+            fields = unpack_header(data)
+            if fields is None:
                 logger.warning(f"[VM Forward] Invalid message header (len={len(data)})")
                 continue
+            msg_type, _, client_id, msg_port = fields
 
-            msg_type = header.msg_type
-            payload = get_payload(data)
+            payload = get_payload_view(data)
 
             await _handle_vm_pf_message(
                 msg_type,
-                header,
+                client_id,
+                msg_port,
                 payload,
                 data,
                 port,
                 vm_ip,
                 proto,
-                websocket,
+                sender,
                 active_connections,
-                stop_event,
             )
 
     except WebSocketDisconnect:
@@ -863,5 +1203,6 @@ async def _handle_vm_port_forward(
     except Exception as e:
         logger.error(f"[VM Forward] Error: {e}")
     finally:
-        await _cleanup_vm_connections(active_connections, stop_event)
+        _cleanup_vm_connections(active_connections)
+        await sender.stop()
         logger.info(f"[VM Forward] Session closed (VM {task_id})")
@@ -24,7 +24,12 @@ import httpx
 
 from kohakuriver.models.overlay_subnet import OverlaySubnetConfig
 from kohakuriver.runner.config import config
-from kohakuriver.runner.services.overlay_manager import RunnerOverlayManager
+from kohakuriver.runner.services.overlay_manager import (
+    RunnerOverlayManager,
+    iptables_cidr,
+    iptables_rule_saved,
+    parse_iptables_save,
+)
 from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -36,6 +41,12 @@ def _tap_name(task_id: int) -> str:
     return f"tap-{h}"
 
 
+def _link_index(ipr, ifname: str) -> int | None:
+    """Look up an interface index by name (kernel-side filter, no full dump)."""
+    indexes = ipr.link_lookup(ifname=ifname)
+    return indexes[0] if indexes else None
+
+
 def _generate_mac(task_id: int) -> str:
     """Generate a deterministic MAC address from task_id.
 
@@ -131,10 +142,7 @@ class VMNetworkManager:
 
         ipr = IPRoute()
         try:
-            for link in ipr.get_links():
-                if link.get_attr("IFLA_IFNAME") == bridge_name:
-                    return True
-            return False
+            return _link_index(ipr, bridge_name) is not None
         finally:
             ipr.close()
 
@@ -156,20 +164,13 @@ class VMNetworkManager:
             bridge_name = config.VM_BRIDGE_NAME
 
             # Check if bridge already exists
-            bridge_idx = None
-            for link in ipr.get_links():
-                if link.get_attr("IFLA_IFNAME") == bridge_name:
-                    bridge_idx = link["index"]
-                    logger.info(f"NAT bridge {bridge_name} already exists")
-                    break
-
-            if bridge_idx is None:
+            bridge_idx = _link_index(ipr, bridge_name)
+            if bridge_idx is not None:
+                logger.info(f"NAT bridge {bridge_name} already exists")
+            else:
                 logger.info(f"Creating NAT bridge: {bridge_name}")
                 ipr.link("add", ifname=bridge_name, kind="bridge")
-                for link in ipr.get_links():
-                    if link.get_attr("IFLA_IFNAME") == bridge_name:
-                        bridge_idx = link["index"]
-                        break
+                bridge_idx = _link_index(ipr, bridge_name)
 
             if bridge_idx is None:
                 raise RuntimeError(f"Failed to create bridge {bridge_name}")
@@ -209,60 +210,112 @@ class VMNetworkManager:
             ipr.close()
 
     def _setup_nat_firewall_rules(self) -> None:
-        """Set up iptables MASQUERADE and FORWARD rules for NAT bridge."""
-        subnet = config.VM_BRIDGE_SUBNET
-
-        # MASQUERADE for internet access
-        nat_check = [
-            "iptables",
-            "-t",
-            "nat",
-            "-C",
-            "POSTROUTING",
-            "-s",
-            subnet,
-            "!",
-            "-d",
-            subnet,
-            "-j",
-            "MASQUERADE",
-        ]
-        nat_add = [
-            "iptables",
-            "-t",
-            "nat",
-            "-A",
-            "POSTROUTING",
-            "-s",
-            subnet,
-            "!",
-            "-d",
-            subnet,
-            "-j",
-            "MASQUERADE",
+        """
+        Set up iptables MASQUERADE and FORWARD rules for NAT bridge.
+
+        Existing rules are read with one iptables-save, and the missing ones
+        are committed together in a single iptables-restore --noflush run
+        instead of one iptables process per check and per rule.
+        """
+        # Written the way iptables-save prints it so existing rules match
+        subnet = iptables_cidr(config.VM_BRIDGE_SUBNET)
+
+        # (table, chain, rule spec, how to add it)
+        rules = [
+            # MASQUERADE for internet access
+            (
+                "nat",
+                "POSTROUTING",
+                ["-s", subnet, "!", "-d", subnet, "-j", "MASQUERADE"],
+                ["-A", "POSTROUTING"],
+            ),
+            # FORWARD rules (inserted at the top of the chain)
+            (
+                "filter",
+                "FORWARD",
+                ["-s", subnet, "-j", "ACCEPT"],
+                ["-I", "FORWARD", "1"],
+            ),
+            (
+                "filter",
+                "FORWARD",
+                ["-d", subnet, "-j", "ACCEPT"],
+                ["-I", "FORWARD", "1"],
+            ),
         ]
+
+        saved = self._iptables_save_sync()
+        missing: dict[str, list[str]] = {}
+        for table, chain, spec, add in rules:
+            if self._iptables_rule_exists_sync(saved, table, chain, spec):
+                logger.debug(
+                    f"iptables rule already exists: -A {chain} {' '.join(spec)}"
+                )
+                continue
+            missing.setdefault(table, []).append(" ".join(add + spec))
+
+        if not missing:
+            return
+
+        script = "".join(
+            f"*{table}\n" + "".join(f"{line}\n" for line in lines) + "COMMIT\n"
+            for table, lines in missing.items()
+        )
         try:
-            subprocess.run(nat_check, check=True, capture_output=True)
-            logger.debug("NAT masquerade rule already exists")
-        except subprocess.CalledProcessError:
-            try:
-                subprocess.run(nat_add, check=True, capture_output=True)
-                logger.info("Added NAT masquerade rule for VM bridge")
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to add NAT rule: {e}")
-
-        # FORWARD rules
-        for direction in ["-s", "-d"]:
-            check = ["iptables", "-C", "FORWARD", direction, subnet, "-j", "ACCEPT"]
-            add = ["iptables", "-I", "FORWARD", "1", direction, subnet, "-j", "ACCEPT"]
-            try:
-                subprocess.run(check, check=True, capture_output=True)
-            except subprocess.CalledProcessError:
-                try:
-                    subprocess.run(add, check=True, capture_output=True)
-                    logger.info(f"Added FORWARD rule for {direction} {subnet}")
-                except subprocess.CalledProcessError as e:
-                    logger.warning(f"Failed to add FORWARD rule: {e}")
+            subprocess.run(
+                ["iptables-restore", "--noflush"],
+                input=script,
+                text=True,
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError as e:
+            logger.warning(
+                f"Failed to add VM bridge iptables rules: {e.stderr.strip()}"
+            )
+            return
+        except OSError as e:
+            logger.warning(f"Failed to add VM bridge iptables rules: {e}")
+            return
+
+        for table, lines in missing.items():
+            for line in lines:
+                logger.info(f"Added iptables rule for VM bridge ({table}): {line}")
+
+    @staticmethod
+    def _iptables_save_sync() -> dict[str, set[str]] | None:
+        """
+        Dump the rules of all iptables tables.
+
+        Returns:
+            parse_iptables_save() result, or None if iptables-save failed.
+        """
+        try:
+            result = subprocess.run(
+                ["iptables-save"], check=True, capture_output=True, text=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.debug(f"iptables-save failed, falling back to -C: {e}")
+            return None
+        return parse_iptables_save(result.stdout)
+
+    @staticmethod
+    def _iptables_rule_exists_sync(
+        saved: dict[str, set[str]] | None, table: str, chain: str, spec: list[str]
+    ) -> bool:
+        """
+        Check whether a rule exists in a chain.
+
+        Uses the iptables-save dump when available, otherwise falls back
+        to a per-rule `iptables -C` invocation.
+        """
+        if saved is not None:
+            return iptables_rule_saved(saved, table, chain, spec)
+
+        result = subprocess.run(
+            ["iptables", "-t", table, "-C", chain, *spec], capture_output=True
+        )
+        return result.returncode == 0
 
     # =========================================================================
     # VM Network Lifecycle
@@ -410,39 +463,27 @@ class VMNetworkManager:
         """Create TAP device and attach to bridge."""
         from pyroute2 import IPRoute
 
-        # Create TAP via ip tuntap (pyroute2's TUN/TAP API is unreliable)
-        tap_exists = False
         ipr = IPRoute()
         try:
-            for link in ipr.get_links():
-                if link.get_attr("IFLA_IFNAME") == tap_name:
-                    tap_exists = True
-                    logger.info(f"TAP {tap_name} already exists")
-                    break
-        finally:
-            ipr.close()
-
-        if not tap_exists:
-            logger.info(f"Creating TAP device: {tap_name}")
-            result = subprocess.run(
-                ["ip", "tuntap", "add", "dev", tap_name, "mode", "tap"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to create TAP {tap_name}: {result.stderr}")
+            tap_idx = _link_index(ipr, tap_name)
+            if tap_idx is not None:
+                logger.info(f"TAP {tap_name} already exists")
+            else:
+                # Create TAP via ip tuntap (pyroute2's TUN/TAP API is unreliable)
+                logger.info(f"Creating TAP device: {tap_name}")
+                result = subprocess.run(
+                    ["ip", "tuntap", "add", "dev", tap_name, "mode", "tap"],
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode != 0:
+                    raise RuntimeError(
+                        f"Failed to create TAP {tap_name}: {result.stderr}"
+                    )
+                tap_idx = _link_index(ipr, tap_name)
 
-        # Attach to bridge and bring up via pyroute2
-        ipr = IPRoute()
-        try:
-            tap_idx = None
-            bridge_idx = None
-            for link in ipr.get_links():
-                name = link.get_attr("IFLA_IFNAME")
-                if name == tap_name:
-                    tap_idx = link["index"]
-                elif name == bridge_name:
-                    bridge_idx = link["index"]
+            # Attach to bridge and bring up via pyroute2
+            bridge_idx = _link_index(ipr, bridge_name)
 
             if tap_idx is None:
                 raise RuntimeError(f"TAP {tap_name} not found after creation")
@@ -461,12 +502,12 @@ class VMNetworkManager:
 
         ipr = IPRoute()
         try:
-            for link in ipr.get_links():
-                if link.get_attr("IFLA_IFNAME") == tap_name:
-                    ipr.link("del", index=link["index"])
-                    logger.info(f"Deleted TAP {tap_name}")
-                    return
-            logger.debug(f"TAP {tap_name} not found for deletion")
+            tap_idx = _link_index(ipr, tap_name)
+            if tap_idx is None:
+                logger.debug(f"TAP {tap_name} not found for deletion")
+                return
+            ipr.link("del", index=tap_idx)
+            logger.info(f"Deleted TAP {tap_name}")
         except Exception as e:
             logger.warning(f"Failed to delete TAP {tap_name}: {e}")
         finally:
@@ -17,7 +17,10 @@ from kohakuriver.tunnel.protocol import (
     PROTO_TCP,
     PROTO_UDP,
     build_message,
+    build_message_into,
     parse_header,
+    unpack_client_id,
+    unpack_header,
 )
 
 __all__ = [
@@ -32,5 +35,8 @@ __all__ = [
     "PROTO_TCP",
     "PROTO_UDP",
     "build_message",
+    "build_message_into",
     "parse_header",
+    "unpack_client_id",
+    "unpack_header",
 ]
@@ -40,6 +40,13 @@ PROTO_UDP: int = 0x01
 HEADER_FORMAT = ">BBIH"  # Big-endian: byte, byte, uint32, uint16
 HEADER_SIZE = struct.calcsize(HEADER_FORMAT)  # 8 bytes
 
+# Precompiled header struct (avoids re-parsing HEADER_FORMAT per message)
+HEADER_STRUCT = struct.Struct(HEADER_FORMAT)
+
+# client_id field alone, for routing DATA without unpacking the whole header
+CLIENT_ID_STRUCT = struct.Struct(">I")
+CLIENT_ID_OFFSET = 2
+
 
 @dataclass
 class TunnelHeader:
@@ -71,8 +78,34 @@ def build_message(
     Returns:
         Complete message as bytes
     """
-    header = struct.pack(HEADER_FORMAT, msg_type, proto, client_id, port)
-    return header + payload
+    return HEADER_STRUCT.pack(msg_type, proto, client_id, port) + payload
+
+
+def build_message_into(
+    buf: bytearray,
+    msg_type: int,
+    proto: int,
+    client_id: int,
+    port: int = 0,
+) -> int:
+    """
+    Write a tunnel message header into the start of a caller-owned buffer.
+
+    Lets hot paths place the payload directly after the header in a reused
+    buffer instead of concatenating header and payload per message.
+
+    Args:
+        buf: Buffer of at least HEADER_SIZE bytes
+        msg_type: Message type (MSG_CONNECT, MSG_DATA, etc.)
+        proto: Protocol type (PROTO_TCP or PROTO_UDP)
+        client_id: Connection identifier
+        port: Target port (used in CONNECT messages)
+
+    Returns:
+        Number of header bytes written (HEADER_SIZE)
+    """
+    HEADER_STRUCT.pack_into(buf, 0, msg_type, proto, client_id, port)
+    return HEADER_SIZE
 
 
 def parse_header(data: bytes) -> TunnelHeader | None:
@@ -88,10 +121,40 @@ def parse_header(data: bytes) -> TunnelHeader | None:
     if len(data) < HEADER_SIZE:
         return None
 
-    msg_type, proto, client_id, port = struct.unpack(HEADER_FORMAT, data[:HEADER_SIZE])
+    msg_type, proto, client_id, port = HEADER_STRUCT.unpack_from(data)
     return TunnelHeader(msg_type=msg_type, proto=proto, client_id=client_id, port=port)
 
 
+def unpack_header(data: bytes) -> tuple[int, int, int, int] | None:
+    """
+    Unpack the header fields of a tunnel message.
+
+    Hot-path variant of parse_header() that skips building a TunnelHeader.
+
+    Args:
+        data: Raw message bytes
+
+    Returns:
+        (msg_type, proto, client_id, port), or None if data too short
+    """
+    if len(data) < HEADER_SIZE:
+        return None
+    return HEADER_STRUCT.unpack_from(data)
+
+
+def unpack_client_id(data: bytes) -> int:
+    """
+    Read only the client_id of a tunnel message.
+
+    Args:
+        data: Raw message bytes (must be at least HEADER_SIZE bytes)
+
+    Returns:
+        The client_id header field
+    """
+    return CLIENT_ID_STRUCT.unpack_from(data, CLIENT_ID_OFFSET)[0]
+
+
 def get_payload(data: bytes) -> bytes:
     """
     Extract payload from a tunnel message.
@@ -103,3 +166,16 @@ def get_payload(data: bytes) -> bytes:
         Payload bytes (everything after header)
     """
     return data[HEADER_SIZE:] if len(data) > HEADER_SIZE else b""
+
+
+def get_payload_view(data: bytes) -> memoryview:
+    """
+    Get the payload of a tunnel message without copying it.
+
+    Args:
+        data: Raw message bytes
+
+    Returns:
+        Memoryview of everything after the header (empty if none)
+    """
+    return memoryview(data)[HEADER_SIZE:]
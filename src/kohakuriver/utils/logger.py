@@ -153,6 +153,10 @@ def intercept_standard_logging(silence_peewee: bool = True) -> None:
 # Track if logging has been configured
 _configured = False
 
+# Severity number of the lowest level that reaches the console handler
+# (loguru's default handler logs DEBUG and above)
+_min_level_no = _loguru_logger.level("DEBUG").no
+
 
 def configure_logging(
     level: LogLevel = LogLevel.INFO,
@@ -176,7 +180,7 @@ def configure_logging(
 
         configure_logging(LogLevel.DEBUG)
     """
-    global _configured
+    global _configured, _min_level_no
 
     # Map HakuRiver levels to loguru levels
     level_map = {
@@ -207,6 +211,7 @@ def configure_logging(
         intercept_standard_logging()
 
     _configured = True
+    _min_level_no = _loguru_logger.level(log_level).no
     _loguru_logger.bind(name="kohakuriver.logger").debug(
         f"Logging configured: level={log_level}"
     )
@@ -235,6 +240,22 @@ def get_logger(name: str):
     return _loguru_logger.bind(name=name)
 
 
+def is_level_enabled(level: str) -> bool:
+    """
+    Check whether messages at a level would be emitted.
+
+    Lets hot paths skip building log messages (f-strings) that would be
+    filtered out anyway.
+
+    Args:
+        level: Loguru level name (e.g. "DEBUG").
+
+    Returns:
+        True if messages at this level reach the configured handler.
+    """
+    return _loguru_logger.level(level).no >= _min_level_no
+
+
 # =============================================================================
 # Traceback Formatting
 # =============================================================================